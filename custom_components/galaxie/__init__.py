@@ -1,9 +1,9 @@
 """The Galaxie integration."""
 
-import aiohttp
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import DOMAIN
 from .coordinator import GalaxieDataCoordinator
@@ -18,20 +18,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Galaxie from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
-    # Create aiohttp session
-    session = aiohttp.ClientSession()
-
-    # Create coordinator
-    coordinator = GalaxieDataCoordinator(hass, session)
+    # Create coordinator on Home Assistant's shared (pooled) aiohttp session
+    coordinator = GalaxieDataCoordinator(hass, async_get_clientsession(hass))
 
     # Store coordinator in hass data
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
-        "session": session,
     }
 
-    # Start coordinator
-    await coordinator.async_config_entry_first_refresh()
+    # Fetch the first data in the background so a slow or unreachable API
+    # doesn't hold up startup; entities fill in once the refresh lands.
+    entry.async_create_background_task(
+        hass, coordinator.async_refresh(), "galaxie-first-refresh"
+    )
 
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -45,10 +44,6 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
         await coordinator.async_shutdown()
 
-        # Clean up session
-        session = hass.data[DOMAIN][entry.entry_id]["session"]
-        await session.close()
-
         # Remove from hass data
         hass.data[DOMAIN].pop(entry.entry_id)
     return unload_ok
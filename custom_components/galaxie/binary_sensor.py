@@ -4,8 +4,9 @@ import logging
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DEVICE_CLASS_LIVE_STATUS, DOMAIN
 from .device import get_live_status_device
@@ -28,65 +29,52 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class LiveRaceStatusBinarySensor(BinarySensorEntity):
+class LiveRaceStatusBinarySensor(CoordinatorEntity, BinarySensorEntity):
     """Live race status binary sensor."""
 
     def __init__(self, coordinator):
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self._attr_unique_id = "live_race_status"
         self._attr_name = "Live Race Status"
         self._attr_device_class = DEVICE_CLASS_LIVE_STATUS
         self._attr_icon = "mdi:flag-checkered"
         self._attr_device_info = get_live_status_device()
+        self._attr_is_on = self._compute_is_on()
+        self._attr_available = self._compute_available()
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self.coordinator.data is not None
-            and "live_race" in self.coordinator.data
-        )
-
-    async def async_added_to_hass(self) -> None:
-        """When entity is added to hass."""
-        await super().async_added_to_hass()
-        self.coordinator.async_add_listener(self._handle_coordinator_update)
-
-    async def async_will_remove_from_hass(self) -> None:
-        """When entity will be removed from hass."""
-        await super().async_will_remove_from_hass()
+        # CoordinatorEntity.available ignores _attr_available, so serve the
+        # value cached on the last coordinator update.
+        return self._attr_available
 
+    @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         version = self.coordinator.backend_version
         if version != "unknown":
             self._attr_device_info = get_live_status_device(sw_version=version)
+        self._attr_is_on = self._compute_is_on()
+        self._attr_available = self._compute_available()
         self.async_write_ha_state()
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if there is a live race."""
+    def _compute_available(self) -> bool:
+        """Return True if the coordinator has usable live race data."""
         data = self.coordinator.data
-        if not data or "live_race" not in data:
-            _LOGGER.debug(
-                "No live_race data available for binary sensor %s", self._attr_name
-            )
-            return False
-
-        live_races = data["live_race"]
-        # Check if there are any live races
-        is_live = (
-            isinstance(live_races, list)
-            and len(live_races) > 0
-            and all(isinstance(race, dict) for race in live_races)
-        )
-        _LOGGER.debug(
-            "Binary sensor %s: live_races=%s, is_live=%s",
-            self._attr_name,
-            live_races,
-            is_live,
+        return bool(
+            self.coordinator.last_update_success
+            and data is not None
+            and "live_race" in data
         )
+
+    def _compute_is_on(self) -> bool:
+        """Return true if there is a live race."""
+        data = self.coordinator.data
+        # The coordinator only publishes a current race for a valid live list
+        is_live = bool(data) and data.get("live_race_current") is not None
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Binary sensor %s: is_live=%s", self._attr_name, is_live)
         return is_live
 
     @property
@@ -1,6 +1,7 @@
 """Constants for the Galaxie integration."""
 
 from datetime import timedelta
+from functools import lru_cache
 
 DOMAIN = "galaxie"
 DEFAULT_NAME = "Galaxie NASCAR"
@@ -42,6 +43,9 @@ CENTRIFUGO_TOKEN_PATH = "/api/centrifugo/token/"
 # Update intervals
 UPDATE_INTERVAL_PREVIOUS_NEXT = timedelta(minutes=15)
 UPDATE_INTERVAL_LIVE = timedelta(seconds=15)
+# Ceiling for the live poll interval while no race is running (backs off from
+# UPDATE_INTERVAL_LIVE by doubling on each empty /api/live/ response).
+UPDATE_INTERVAL_LIVE_IDLE_MAX = timedelta(minutes=10)
 UPDATE_INTERVAL_CONFIG = timedelta(hours=1)
 UPDATE_INTERVAL_WEATHER = timedelta(minutes=5)
 
@@ -49,16 +53,32 @@ UPDATE_INTERVAL_WEATHER = timedelta(minutes=5)
 DEVICE_CLASS_LIVE_STATUS = "connectivity"
 
 
-# Device info templates
+# Device info templates; only identifiers, name and sw_version vary per device
+_PREVIOUS_RACE_DEVICE_BASE = {
+    "manufacturer": "Galaxie",
+    "model": "NASCAR Previous Race",
+}
+_NEXT_RACE_DEVICE_BASE = {"manufacturer": "Galaxie", "model": "NASCAR Next Race"}
+_LIVE_RACE_DEVICE_BASE = {"manufacturer": "Galaxie", "model": "NASCAR Live Race"}
+_LIVE_STATUS_DEVICE_BASE = {
+    "name": "Galaxie Live Status",
+    "manufacturer": "Galaxie",
+    "model": "NASCAR Live Status",
+}
+
+
+@lru_cache(maxsize=16)
+def series_slug(series_name: str) -> str:
+    """Return the identifier-safe form of a series name."""
+    return series_name.lower().replace(" ", "_")
+
+
 def get_previous_race_device_info(series_name: str, sw_version: str = "1.0.0"):
     """Get device info for previous race device."""
     return {
-        "identifiers": {
-            (DOMAIN, f"previous_race_{series_name.lower().replace(' ', '_')}")
-        },
+        **_PREVIOUS_RACE_DEVICE_BASE,
+        "identifiers": {(DOMAIN, f"previous_race_{series_slug(series_name)}")},
         "name": f"Previous Race {series_name}",
-        "manufacturer": "Galaxie",
-        "model": "NASCAR Previous Race",
         "sw_version": sw_version,
     }
 
@@ -66,10 +86,9 @@ def get_previous_race_device_info(series_name: str, sw_version: str = "1.0.0"):
 def get_next_race_device_info(series_name: str, sw_version: str = "1.0.0"):
     """Get device info for next race device."""
     return {
-        "identifiers": {(DOMAIN, f"next_race_{series_name.lower().replace(' ', '_')}")},
+        **_NEXT_RACE_DEVICE_BASE,
+        "identifiers": {(DOMAIN, f"next_race_{series_slug(series_name)}")},
         "name": f"Next Race {series_name}",
-        "manufacturer": "Galaxie",
-        "model": "NASCAR Next Race",
         "sw_version": sw_version,
     }
 
@@ -77,10 +96,9 @@ def get_next_race_device_info(series_name: str, sw_version: str = "1.0.0"):
 def get_live_race_device_info(run_id: str, run_name: str, sw_version: str = "1.0.0"):
     """Get device info for live race device."""
     return {
+        **_LIVE_RACE_DEVICE_BASE,
         "identifiers": {(DOMAIN, f"live_race_{run_id}")},
         "name": f"Live Race {run_name}",
-        "manufacturer": "Galaxie",
-        "model": "NASCAR Live Race",
         "sw_version": sw_version,
     }
 
@@ -88,9 +106,7 @@ def get_live_race_device_info(run_id: str, run_name: str, sw_version: str = "1.0
 def get_live_status_device_info(sw_version: str = "1.0.0"):
     """Get device info for live status device."""
     return {
+        **_LIVE_STATUS_DEVICE_BASE,
         "identifiers": {(DOMAIN, "live_status")},
-        "name": "Galaxie Live Status",
-        "manufacturer": "Galaxie",
-        "model": "NASCAR Live Status",
         "sw_version": sw_version,
     }
@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime
+import time
+from importlib.util import find_spec
+from typing import Any
 
 import aiohttp
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util.json import json_loads
 
 from .const import (
     API_ENDPOINTS,
@@ -16,12 +19,56 @@ from .const import (
     DOMAIN,
     UPDATE_INTERVAL_CONFIG,
     UPDATE_INTERVAL_LIVE,
+    UPDATE_INTERVAL_LIVE_IDLE_MAX,
+    UPDATE_INTERVAL_PREVIOUS_NEXT,
     UPDATE_INTERVAL_WEATHER,
 )
 from .websocket_client import GalaxieWebSocketClient
 
 _LOGGER = logging.getLogger(__name__)
 
+# aiohttp only decodes brotli when one of these is installed; don't advertise
+# an encoding we can't read.
+_HAS_BROTLI = find_spec("brotlicffi") is not None or find_spec("brotli") is not None
+REQUEST_HEADERS = {
+    "Accept-Encoding": "gzip, deflate, br" if _HAS_BROTLI else "gzip, deflate"
+}
+
+# Bound every REST call so a hung connection can't stall the 15s update tick.
+# Requests go through HA's shared session, whose connector already keeps
+# connections to the API host alive between ticks.
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=5, sock_read=8)
+
+# Fetch gates compare monotonic timestamps, so keep the intervals as seconds.
+_PREV_NEXT_INTERVAL_S = UPDATE_INTERVAL_PREVIOUS_NEXT.total_seconds()
+_CONFIG_INTERVAL_S = UPDATE_INTERVAL_CONFIG.total_seconds()
+_WEATHER_INTERVAL_S = UPDATE_INTERVAL_WEATHER.total_seconds()
+
+# run_detail and vehicle_list pushes usually land milliseconds apart; wait this
+# long (seconds) so both fan out to entities in a single update.
+PUSH_COALESCE_DELAY = 0.02
+# vehicle_list can burst many times per second; only the latest snapshot within
+# this window (seconds) is applied.
+VEHICLE_LIST_FLUSH_DELAY = 0.1
+
+
+def races_by_series(races: list) -> dict[str, dict]:
+    """Index a previous/next race list by series name, first entry winning."""
+    return {
+        race["series_name"]: race
+        for race in reversed(races)
+        if isinstance(race, dict) and "series_name" in race
+    }
+
+
+def vehicles_by_position(vehicles: list) -> dict[int, dict]:
+    """Index a vehicle list by running position, first entry winning."""
+    return {
+        vehicle["running_position"]: vehicle
+        for vehicle in reversed(vehicles)
+        if isinstance(vehicle, dict) and "running_position" in vehicle
+    }
+
 
 class GalaxieDataCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Galaxie data."""
@@ -35,15 +82,39 @@ class GalaxieDataCoordinator(DataUpdateCoordinator):
             update_interval=UPDATE_INTERVAL_LIVE,
         )
         self.session = session
-        self.data = {}
+        self.data = {
+            "previous_race": [],
+            "previous_race_by_series": {},
+            "next_race": [],
+            "next_race_by_series": {},
+            "live_race": [],
+            "live_race_current": None,
+            "config": None,
+            "vehicle_list": [],
+            "vehicle_list_by_position": {},
+            "weather": None,
+        }
+        self._url_previous = f"{BASE_URL}{API_ENDPOINTS['previous_race']}"
+        self._url_next = f"{BASE_URL}{API_ENDPOINTS['next_race']}"
+        self._url_live = f"{BASE_URL}{API_ENDPOINTS['live']}"
+        self._url_config = f"{BASE_URL}{API_ENDPOINTS['config']}"
+        self._weather_url_template = f"{BASE_URL}/api/runs/{{}}/weather/"
+        self._last_prev_next_fetch: float | None = None
         self._config_data: dict | None = None
-        self._last_config_fetch: datetime | None = None
+        self._last_config_fetch: float | None = None
         self._ws_client: GalaxieWebSocketClient | None = None
         self._current_run_id: str | None = None
         self._ws_live_data: dict | None = None
         self._ws_vehicle_data: list | None = None
         self._weather_data: dict | None = None
-        self._last_weather_fetch: datetime | None = None
+        self._last_weather_fetch: float | None = None
+        self._empty_live_streak = 0
+        self._push_handle: asyncio.TimerHandle | None = None
+        self._pending_vehicle: list | None = None
+        self._updating = False
+        # Validators and bodies of the last 200 for conditional endpoints
+        self._validators: dict[str, dict[str, str]] = {}
+        self._json_cache: dict[str, Any] = {}
 
     @property
     def backend_version(self) -> str:
@@ -52,31 +123,105 @@ class GalaxieDataCoordinator(DataUpdateCoordinator):
             return self._config_data.get("version", "unknown")
         return "unknown"
 
+    def _should_fetch_previous_next(self) -> bool:
+        """Return True if previous/next race data should be refreshed."""
+        if self._last_prev_next_fetch is None:
+            return True
+        return time.monotonic() - self._last_prev_next_fetch >= _PREV_NEXT_INTERVAL_S
+
     def _should_fetch_config(self) -> bool:
         """Return True if config data should be refreshed."""
         if self._config_data is None or self._last_config_fetch is None:
             return True
-        return (datetime.now() - self._last_config_fetch) >= UPDATE_INTERVAL_CONFIG
+        return time.monotonic() - self._last_config_fetch >= _CONFIG_INTERVAL_S
 
     def _should_fetch_weather(self) -> bool:
         """Return True if weather data should be refreshed."""
         if self._weather_data is None or self._last_weather_fetch is None:
             return True
-        return (datetime.now() - self._last_weather_fetch) >= UPDATE_INTERVAL_WEATHER
+        return time.monotonic() - self._last_weather_fetch >= _WEATHER_INTERVAL_S
+
+    def _update_live_backoff(self, live_race: list) -> None:
+        """Back off live polling while no race is running; reset once one is."""
+        if live_race:
+            self._empty_live_streak = 0
+            self.update_interval = UPDATE_INTERVAL_LIVE
+            return
+        if self.update_interval < UPDATE_INTERVAL_LIVE_IDLE_MAX:
+            self._empty_live_streak += 1
+        self.update_interval = min(
+            UPDATE_INTERVAL_LIVE_IDLE_MAX,
+            UPDATE_INTERVAL_LIVE * (2**self._empty_live_streak),
+        )
+
+    @staticmethod
+    def _set_live_race(data: dict, live_race: list) -> None:
+        """Store the live race list and the race sensors read from.
+
+        Non-dict entries are dropped here so live sensors can skip shape checks.
+        """
+        live_race = [race for race in live_race if isinstance(race, dict)]
+        data["live_race"] = live_race
+        data["live_race_current"] = live_race[0] if live_race else None
+
+    @staticmethod
+    def _set_vehicle_list(data: dict, vehicles: list) -> None:
+        """Store the vehicle list, re-indexing it only when it changes."""
+        if (
+            vehicles is not data.get("vehicle_list")
+            or "vehicle_list_by_position" not in data
+        ):
+            data["vehicle_list_by_position"] = vehicles_by_position(vehicles)
+        data["vehicle_list"] = vehicles
+
+    def _schedule_push(self, delay: float = PUSH_COALESCE_DELAY) -> None:
+        """Coalesce WebSocket pushes arriving together into one listener update."""
+        if self._push_handle is None:
+            self._push_handle = self.hass.loop.call_later(delay, self._flush_push)
+
+    def _flush_push(self) -> None:
+        """Apply the latest pending vehicle snapshot and notify listeners."""
+        self._push_handle = None
+        if self._pending_vehicle is not None:
+            self._ws_vehicle_data = self._pending_vehicle
+            self._pending_vehicle = None
+            if self.data is not None:
+                self._set_vehicle_list(self.data, self._ws_vehicle_data)
+        if self.data is not None:
+            self.async_set_updated_data(self.data)
 
     def _ws_on_run_detail(self, data: dict) -> None:
         """Handle run_detail push from WebSocket."""
         self._ws_live_data = data
         if self.data is not None:
-            self.data["live_race"] = [data]
-            self.async_set_updated_data(self.data)
+            self._set_live_race(self.data, [data])
+            self._schedule_push()
 
     def _ws_on_vehicle_list(self, data: list) -> None:
-        """Handle vehicle_list push from WebSocket."""
-        self._ws_vehicle_data = data
-        if self.data is not None:
-            self.data["vehicle_list"] = data
-            self.async_set_updated_data(self.data)
+        """Handle vehicle_list push from WebSocket.
+
+        Only the newest snapshot is kept while a flush is pending, so bursts of
+        vehicle_list frames (e.g. under caution) collapse into one update.
+        """
+        self._pending_vehicle = data
+        self._schedule_push(VEHICLE_LIST_FLUSH_DELAY)
+
+    def _resume_live_polling(self) -> None:
+        """Poll live data over REST at the live cadence, starting right away.
+
+        Setting update_interval alone doesn't move a refresh that is already
+        scheduled at the slower WebSocket cadence, so request one now. A
+        refresh in progress reschedules itself with the new interval when it
+        finishes.
+        """
+        self.update_interval = UPDATE_INTERVAL_LIVE
+        if not self._updating and not self._shutdown_requested:
+            self.hass.async_create_task(self.async_request_refresh())
+
+    def _ws_on_connection_lost(self) -> None:
+        """Handle the WebSocket dropping while centrifuge-python reconnects."""
+        _LOGGER.info("WebSocket connection lost, polling live data over REST")
+        self._resume_live_polling()
 
     def _ws_on_disconnect(self) -> None:
         """Handle WebSocket disconnect -- resume REST polling for live data."""
@@ -85,10 +230,15 @@ class GalaxieDataCoordinator(DataUpdateCoordinator):
         self._current_run_id = None
         self._ws_live_data = None
         self._ws_vehicle_data = None
+        self._pending_vehicle = None
+        self._resume_live_polling()
 
     async def _manage_ws_connection(self, live_race_data: list) -> None:
-        """Start/stop WebSocket based on live race availability."""
-        if live_race_data and isinstance(live_race_data[0], dict):
+        """Start/stop WebSocket based on live race availability.
+
+        live_race_data has already been filtered to dicts by _set_live_race.
+        """
+        if live_race_data:
             run_id = live_race_data[0].get("id")
             if run_id and run_id != self._current_run_id:
                 # New or different run -- disconnect old, connect new
@@ -102,6 +252,7 @@ class GalaxieDataCoordinator(DataUpdateCoordinator):
                     on_run_detail=self._ws_on_run_detail,
                     on_vehicle_list=self._ws_on_vehicle_list,
                     on_disconnect=self._ws_on_disconnect,
+                    on_connection_lost=self._ws_on_connection_lost,
                 )
                 self._ws_client.start()
                 _LOGGER.info("Started Centrifugo subscription for run %s", run_id)
@@ -118,7 +269,14 @@ class GalaxieDataCoordinator(DataUpdateCoordinator):
             self._last_weather_fetch = None
 
     async def async_shutdown(self) -> None:
-        """Clean up WebSocket connection on unload."""
+        """Cancel pending work and clean up WebSocket connection on unload."""
+        await super().async_shutdown()
+        if self._push_handle is not None:
+            self._push_handle.cancel()
+            self._push_handle = None
+        self._pending_vehicle = None
+        self._validators.clear()
+        self._json_cache.clear()
         if self._ws_client:
             await self._ws_client.stop()
             self._ws_client = None
@@ -130,28 +288,48 @@ class GalaxieDataCoordinator(DataUpdateCoordinator):
 
     async def _async_update_data(self):
         """Update data via API."""
-        _LOGGER.debug("Starting Galaxie data update")
+        self._updating = True
         try:
+            fetch_prev_next = self._should_fetch_previous_next()
             fetch_config = self._should_fetch_config()
 
             # If WS is connected and delivering data, skip REST live fetch
             ws_active = self._ws_client is not None and self._ws_client.connected
 
-            tasks = [
-                self._fetch_previous_race(),
-                self._fetch_next_race(),
-            ]
+            tasks = []
+            if fetch_prev_next:
+                tasks.append(self._get_json(self._url_previous, conditional=True))
+                tasks.append(self._get_json(self._url_next, conditional=True))
             if not ws_active:
-                tasks.append(self._fetch_live_race())
+                tasks.append(self._get_json(self._url_live))
             if fetch_config:
-                tasks.append(self._fetch_config())
+                tasks.append(self._get_json(self._url_config, conditional=True))
+
+            # _get_json turns every failure into its default, so only
+            # cancellation can escape here and it should propagate.
+            results = await asyncio.gather(*tasks)
+
+            # Update self.data in place, rebinding only the keys that changed
+            data = self.data
+            idx = 0
+            if fetch_prev_next:
+                previous_race, next_race = results[0], results[1]
+                idx = 2
+                # Sensors look their series up in the *_by_series indexes, so
+                # rebuild them only when the underlying list changes.
+                if isinstance(previous_race, list):
+                    if previous_race is not data["previous_race"]:
+                        data["previous_race_by_series"] = races_by_series(
+                            previous_race
+                        )
+                    data["previous_race"] = previous_race
+                if isinstance(next_race, list):
+                    if next_race is not data["next_race"]:
+                        data["next_race_by_series"] = races_by_series(next_race)
+                    data["next_race"] = next_race
+                if isinstance(previous_race, list) and isinstance(next_race, list):
+                    self._last_prev_next_fetch = time.monotonic()
 
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            previous_race = results[0]
-            next_race = results[1]
-
-            idx = 2
             if not ws_active:
                 live_race = results[idx]
                 idx += 1
@@ -163,148 +341,95 @@ class GalaxieDataCoordinator(DataUpdateCoordinator):
                 config_result = results[idx]
                 if isinstance(config_result, dict):
                     self._config_data = config_result
-                    self._last_config_fetch = datetime.now()
-
-            result = {
-                "previous_race": (
-                    previous_race if isinstance(previous_race, list) else []
-                ),
-                "next_race": (next_race if isinstance(next_race, list) else []),
-                "live_race": (live_race if isinstance(live_race, list) else []),
-                "config": self._config_data,
-                "vehicle_list": self._ws_vehicle_data or [],
-                "weather": self._weather_data,
-            }
+                    self._last_config_fetch = time.monotonic()
+
+            # On a failed live fetch keep the last good list rather than
+            # flashing every live sensor to unavailable for one tick.
+            if isinstance(live_race, list):
+                self._set_live_race(data, live_race)
+            data["config"] = self._config_data
+            self._set_vehicle_list(data, self._ws_vehicle_data or [])
+
+            if ws_active:
+                # Live data is pushed over the WebSocket; slow the REST poll
+                # down to the previous/next cadence until it disconnects.
+                self.update_interval = UPDATE_INTERVAL_PREVIOUS_NEXT
+            else:
+                self._update_live_backoff(data["live_race"])
 
             # Manage WebSocket lifecycle based on live race presence
-            await self._manage_ws_connection(result["live_race"])
+            await self._manage_ws_connection(data["live_race"])
 
             # Fetch weather if live race is active and interval has elapsed
-            if result["live_race"] and self._current_run_id:
+            if data["live_race"] and self._current_run_id:
                 if self._should_fetch_weather():
-                    weather = await self._fetch_weather(self._current_run_id)
+                    weather = await self._get_json(
+                        self._weather_url_template.format(self._current_run_id)
+                    )
                     if isinstance(weather, dict):
                         self._weather_data = weather
-                        self._last_weather_fetch = datetime.now()
-                        result["weather"] = weather
-
-            _LOGGER.debug(
-                "Galaxie data update: previous=%d, next=%d, live=%d, ws=%s",
-                len(result["previous_race"]),
-                len(result["next_race"]),
-                len(result["live_race"]),
-                "connected" if ws_active else "off",
-            )
+                        self._last_weather_fetch = time.monotonic()
+            data["weather"] = self._weather_data
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Galaxie data update: previous=%d, next=%d, live=%d, ws=%s",
+                    len(data["previous_race"]),
+                    len(data["next_race"]),
+                    len(data["live_race"]),
+                    "connected" if ws_active else "off",
+                )
 
-            return result
+            return data
 
         except Exception as err:
             _LOGGER.error("Error in Galaxie data update: %s", err)
             raise UpdateFailed(f"Error communicating with API: {err}")
-
-    async def _fetch_previous_race(self):
-        """Fetch previous race data."""
-        url = f"{BASE_URL}{API_ENDPOINTS['previous_race']}"
-        _LOGGER.debug("Fetching previous race data from: %s", url)
+        finally:
+            self._updating = False
+
+    async def _get_json(
+        self, url: str, default: Any = None, conditional: bool = False
+    ) -> Any:
+        """GET a Galaxie endpoint and return its JSON body, or ``default``.
+
+        With ``conditional`` the last ETag/Last-Modified are sent as
+        ``If-None-Match``/``If-Modified-Since`` and the cached body is returned
+        on a 304.
+        """
+        _LOGGER.debug("Fetching %s", url)
+        headers = REQUEST_HEADERS
+        if conditional and url in self._validators:
+            headers = {**REQUEST_HEADERS, **self._validators[url]}
         try:
-            async with self.session.get(url) as response:
-                _LOGGER.debug("Previous race response status: %s", response.status)
+            async with self.session.get(
+                url, headers=headers, timeout=REQUEST_TIMEOUT
+            ) as response:
+                if response.status == 304 and url in self._json_cache:
+                    return self._json_cache[url]
                 if response.status == 200:
-                    data = await response.json()
-                    _LOGGER.debug(
-                        "Previous race data received: %d items",
-                        len(data) if isinstance(data, list) else 0,
-                    )
-                    return data
-                else:
-                    _LOGGER.warning(
-                        "Previous race API returned status %s", response.status
-                    )
-                    return []
+                    # HA's json_loads is orjson-backed and takes the raw bytes,
+                    # skipping response.json()'s str decode of the whole body.
+                    body = json_loads(await response.read())
+                    if conditional:
+                        self._store_validators(url, response.headers, body)
+                    return body
+                _LOGGER.warning("API %s returned status %s", url, response.status)
+                return default
         except Exception as e:
-            _LOGGER.error("Error fetching previous race data: %s", e)
-            return []
-
-    async def _fetch_next_race(self):
-        """Fetch next race data."""
-        url = f"{BASE_URL}{API_ENDPOINTS['next_race']}"
-        _LOGGER.debug("Fetching next race data from: %s", url)
-        try:
-            async with self.session.get(url) as response:
-                _LOGGER.debug("Next race response status: %s", response.status)
-                if response.status == 200:
-                    data = await response.json()
-                    _LOGGER.debug(
-                        "Next race data received: %d items",
-                        len(data) if isinstance(data, list) else 0,
-                    )
-                    return data
-                else:
-                    _LOGGER.warning("Next race API returned status %s", response.status)
-                    return []
-        except Exception as e:
-            _LOGGER.error("Error fetching next race data: %s", e)
-            return []
-
-    async def _fetch_live_race(self):
-        """Fetch live race data."""
-        url = f"{BASE_URL}{API_ENDPOINTS['live']}"
-        _LOGGER.debug("Fetching live race data from: %s", url)
-        try:
-            async with self.session.get(url) as response:
-                _LOGGER.debug("Live race response status: %s", response.status)
-                if response.status == 200:
-                    data = await response.json()
-                    _LOGGER.debug(
-                        "Live race data received: %d items",
-                        len(data) if isinstance(data, list) else 0,
-                    )
-                    return data
-                else:
-                    _LOGGER.warning("Live race API returned status %s", response.status)
-                    return []
-        except Exception as e:
-            _LOGGER.error("Error fetching live race data: %s", e)
-            return []
-
-    async def _fetch_config(self):
-        """Fetch backend config data."""
-        url = f"{BASE_URL}{API_ENDPOINTS['config']}"
-        _LOGGER.debug("Fetching config data from: %s", url)
-        try:
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    _LOGGER.debug(
-                        "Config data received: version=%s, environment=%s",
-                        data.get("version"),
-                        data.get("environment"),
-                    )
-                    return data
-                else:
-                    _LOGGER.warning("Config API returned status %s", response.status)
-                    return None
-        except Exception as e:
-            _LOGGER.error("Error fetching config data: %s", e)
-            return None
-
-    async def _fetch_weather(self, run_id: str):
-        """Fetch weather data for a live race."""
-        url = f"{BASE_URL}/api/runs/{run_id}/weather/"
-        _LOGGER.debug("Fetching weather data from: %s", url)
-        try:
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    _LOGGER.debug("Weather data received for run %s", run_id)
-                    return data
-                else:
-                    _LOGGER.warning(
-                        "Weather API returned status %s for run %s",
-                        response.status,
-                        run_id,
-                    )
-                    return None
-        except Exception as e:
-            _LOGGER.error("Error fetching weather data: %s", e)
-            return None
+            _LOGGER.error("Error fetching %s: %s", url, e)
+            return default
+
+    def _store_validators(self, url: str, response_headers: Any, body: Any) -> None:
+        """Remember the cache validators and body of a 200 for ``url``."""
+        validators = {}
+        if etag := response_headers.get("ETag"):
+            validators["If-None-Match"] = etag
+        if last_modified := response_headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = last_modified
+        if validators:
+            self._validators[url] = validators
+            self._json_cache[url] = body
+        else:
+            self._validators.pop(url, None)
+            self._json_cache.pop(url, None)
@@ -1,5 +1,7 @@
 """Device for Galaxie integration."""
 
+from functools import lru_cache
+
 from homeassistant.helpers.device_registry import DeviceInfo
 
 from .const import (
@@ -9,52 +11,35 @@ from .const import (
     get_previous_race_device_info,
 )
 
+# DeviceInfo is a plain TypedDict: the cached instances are shared between
+# entities, so treat them as read-only.
+
 
+@lru_cache(maxsize=64)
 def get_previous_race_device(series_name: str, sw_version: str = "1.0.0") -> DeviceInfo:
     """Get device info for previous race device."""
-    device_info = get_previous_race_device_info(series_name, sw_version=sw_version)
     return DeviceInfo(
-        identifiers=device_info["identifiers"],
-        name=device_info["name"],
-        manufacturer=device_info["manufacturer"],
-        model=device_info["model"],
-        sw_version=device_info["sw_version"],
+        **get_previous_race_device_info(series_name, sw_version=sw_version)
     )
 
 
+@lru_cache(maxsize=64)
 def get_next_race_device(series_name: str, sw_version: str = "1.0.0") -> DeviceInfo:
     """Get device info for next race device."""
-    device_info = get_next_race_device_info(series_name, sw_version=sw_version)
-    return DeviceInfo(
-        identifiers=device_info["identifiers"],
-        name=device_info["name"],
-        manufacturer=device_info["manufacturer"],
-        model=device_info["model"],
-        sw_version=device_info["sw_version"],
-    )
+    return DeviceInfo(**get_next_race_device_info(series_name, sw_version=sw_version))
 
 
+@lru_cache(maxsize=64)
 def get_live_race_device(
     run_id: str, run_name: str, sw_version: str = "1.0.0"
 ) -> DeviceInfo:
     """Get device info for live race device."""
-    device_info = get_live_race_device_info(run_id, run_name, sw_version=sw_version)
     return DeviceInfo(
-        identifiers=device_info["identifiers"],
-        name=device_info["name"],
-        manufacturer=device_info["manufacturer"],
-        model=device_info["model"],
-        sw_version=device_info["sw_version"],
+        **get_live_race_device_info(run_id, run_name, sw_version=sw_version)
     )
 
 
+@lru_cache(maxsize=64)
 def get_live_status_device(sw_version: str = "1.0.0") -> DeviceInfo:
     """Get device info for live status device."""
-    device_info = get_live_status_device_info(sw_version=sw_version)
-    return DeviceInfo(
-        identifiers=device_info["identifiers"],
-        name=device_info["name"],
-        manufacturer=device_info["manufacturer"],
-        model=device_info["model"],
-        sw_version=device_info["sw_version"],
-    )
+    return DeviceInfo(**get_live_status_device_info(sw_version=sw_version))
@@ -2,6 +2,7 @@
 
 import logging
 from datetime import datetime
+from functools import lru_cache
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -15,7 +16,7 @@ from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 
-from .const import DOMAIN, FLAG_MAPPING, SERIES_MAPPING
+from .const import DOMAIN, FLAG_MAPPING, SERIES_MAPPING, series_slug
 from .device import (
     get_live_race_device,
     get_live_status_device,
@@ -25,6 +26,24 @@ from .device import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Every live, position and weather sensor attaches to the one live race device.
+_LIVE_RACE_DEVICE = get_live_race_device("live_race", "Live Race")
+
+# Marks a sensor that has not written its state from a coordinator update yet
+_UNWRITTEN = object()
+
+
+@lru_cache(maxsize=32)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an API ISO 8601 timestamp; the same few strings recur every tick."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+@lru_cache(maxsize=64)
+def _position_ids(position: int) -> tuple[str, str]:
+    """Return the (unique_id, name) pair for a vehicle position sensor."""
+    return f"live_race_position_{position}", f"Live Race Position {position}"
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -35,142 +54,101 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
     _LOGGER.info("Setting up Galaxie sensors")
 
-    entities = []
-
-    # Add previous race sensors (3 devices - one per series)
-    for series_id, series_name in SERIES_MAPPING.items():
-        _LOGGER.debug("Creating previous race sensors for series: %s", series_name)
-        entities.extend(
-            [
-                PreviousRaceTrackSensor(coordinator, series_name),
-                PreviousRaceDateSensor(coordinator, series_name),
-                PreviousRaceScheduledDistanceSensor(coordinator, series_name),
-                PreviousRaceScheduledLapsSensor(coordinator, series_name),
-                PreviousRaceCarsSensor(coordinator, series_name),
-                PreviousRaceTVSensor(coordinator, series_name),
-                PreviousRaceRadioSensor(coordinator, series_name),
-                PreviousRacePlayoffSensor(coordinator, series_name),
-                PreviousRaceWinnerSensor(coordinator, series_name),
-                PreviousRaceActualDistanceSensor(coordinator, series_name),
-                PreviousRaceActualLapsSensor(coordinator, series_name),
-                PreviousRaceNameSensor(coordinator, series_name),
-                PreviousRaceTrackTypeSensor(coordinator, series_name),
-            ]
-        )
-
-    # Add next race sensors (3 devices - one per series)
-    for series_id, series_name in SERIES_MAPPING.items():
-        _LOGGER.debug("Creating next race sensors for series: %s", series_name)
-        entities.extend(
-            [
-                NextRaceTrackSensor(coordinator, series_name),
-                NextRaceDateSensor(coordinator, series_name),
-                NextRaceScheduledDistanceSensor(coordinator, series_name),
-                NextRaceScheduledLapsSensor(coordinator, series_name),
-                NextRaceCarsSensor(coordinator, series_name),
-                NextRaceTVSensor(coordinator, series_name),
-                NextRaceRadioSensor(coordinator, series_name),
-                NextRacePlayoffSensor(coordinator, series_name),
-                NextRaceNameSensor(coordinator, series_name),
-                NextRaceTrackTypeSensor(coordinator, series_name),
-            ]
-        )
-
-    # Add live race sensors (dynamic - one device per active run)
-    _LOGGER.debug("Creating live race sensors")
-    entities.extend(
-        [
-            LiveRaceNameSensor(coordinator),
-            LiveRaceTypeSensor(coordinator),
-            LiveRaceStartTimeSensor(coordinator),
-            LiveRaceEndTimeSensor(coordinator),
-            LiveRaceTotalLapsSensor(coordinator),
-            LiveRaceActualLapsSensor(coordinator),
-            LiveRaceScheduledLapsSensor(coordinator),
-            LiveRaceScheduledDistanceSensor(coordinator),
-            LiveRaceStageLapsSensor(coordinator),
-            LiveRaceStageStartSensor(coordinator),
-            LiveRaceStageRemainingSensor(coordinator),
-            LiveRaceStageCompletedSensor(coordinator),
-            LiveRaceStageEndSensor(coordinator),
-            LiveRaceTrackSensor(coordinator),
-            LiveRaceTrackTzSensor(coordinator),
-            LiveRaceLatSensor(coordinator),
-            LiveRaceLngSensor(coordinator),
-            LiveRaceTrackTypeSensor(coordinator),
-            LiveRaceLapNumberSensor(coordinator),
-            LiveRaceFlagSensor(coordinator),
-            LiveRaceCurrentStageSensor(coordinator),
-            LiveRaceLapsRemainingSensor(coordinator),
-            LiveRaceElapsedTimeSensor(coordinator),
-            LiveRaceLengthSensor(coordinator),
-            LiveRaceSeriesSensor(coordinator),
-            LiveRacePitStopDeltaSensor(coordinator),
-            LiveRaceActualDistanceSensor(coordinator),
-            LiveRaceCautionCountSensor(coordinator),
-        ]
-    )
-
-    # Add vehicle position sensors (P1-P5)
-    for position in range(1, 6):
-        entities.append(VehiclePositionSensor(coordinator, position))
-
-    # Add weather sensors
-    entities.extend(
-        [
-            WeatherTemperatureSensor(coordinator),
-            WeatherHumiditySensor(coordinator),
-            WeatherWindSpeedSensor(coordinator),
-            WeatherWindDirectionSensor(coordinator),
-            WeatherRainChanceSensor(coordinator),
-            WeatherConditionsSensor(coordinator),
-        ]
-    )
-
-    # Add diagnostic sensors (attached to Live Status device)
-    entities.append(BackendVersionSensor(coordinator))
+    series_names = SERIES_MAPPING.values()
+    entities = [
+        # Previous/next race sensors (one device per series for each)
+        *(cls(coordinator, name) for name in series_names for cls in PREVIOUS_SENSORS),
+        *(cls(coordinator, name) for name in series_names for cls in NEXT_SENSORS),
+        # Live race sensors (a single live race device)
+        *(cls(coordinator) for cls in LIVE_SENSORS),
+        # Vehicle position sensors (P1-P5)
+        *(VehiclePositionSensor(coordinator, position) for position in range(1, 6)),
+        *(cls(coordinator) for cls in WEATHER_SENSORS),
+        # Diagnostic sensors (attached to Live Status device)
+        BackendVersionSensor(coordinator),
+    ]
 
     _LOGGER.info("Created %d sensors", len(entities))
-    _LOGGER.debug("Sensor entities: %s", [entity._attr_name for entity in entities])
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Sensor entities: %s", [entity._attr_name for entity in entities])
     async_add_entities(entities)
 
 
 # Previous Race Sensors
+PREVIOUS_SENSORS: list[type[SensorEntity]] = []
+
+
 class PreviousRaceBaseSensor(SensorEntity):
     """Base class for previous race sensors."""
 
+    # Entity keeps a __dict__ for its cached properties; slots just make the
+    # hot coordinator lookups descriptor reads.
+    __slots__ = (
+        "coordinator",
+        "series_name",
+        "_last_race",
+        "_last_value",
+        "_written_value",
+    )
+
+    # Coordinator listeners push state; HA must not poll it too
+    _attr_should_poll = False
+
+    # Race payload key returned by the default _extract_value
+    _field: str | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Register the sensor and derive its entity constants at class creation."""
+        super().__init_subclass__(**kwargs)
+        PREVIOUS_SENSORS.append(cls)
+        # Sensors are only built for mapped series, so format their ids up front
+        cls._ids_by_series = {
+            name: (
+                f"previous_race_{series_slug(name)}_{cls.sensor_type}",
+                f"Previous Race {name} {cls.sensor_name}",
+            )
+            for name in SERIES_MAPPING.values()
+        }
+        cls._attr_icon = cls.icon
+
     def __init__(self, coordinator, series_name: str):
         self.coordinator = coordinator
         self.series_name = series_name
-        self._attr_unique_id = (
-            f"previous_race_{series_name.lower().replace(' ', '_')}_{self.sensor_type}"
-        )
-        self._attr_name = f"Previous Race {series_name} {self.sensor_name}"
-        self._attr_icon = self.icon
+        self._last_race = None
+        self._last_value = None
+        self._written_value = _UNWRITTEN
+        self._attr_unique_id, self._attr_name = self._ids_by_series[series_name]
         self._attr_device_info = get_previous_race_device(series_name)
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self.coordinator.data is not None
-            and "previous_race" in self.coordinator.data
-        )
+        self._attr_available = self._compute_available()
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
-        self.coordinator.async_add_listener(self._handle_coordinator_update)
-
-    async def async_will_remove_from_hass(self) -> None:
-        """When entity will be removed from hass."""
-        await super().async_will_remove_from_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
+        )
+        self._attr_available = self._compute_available()
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        available = self._compute_available()
+        value = self.native_value
+        # Most values are unchanged between ticks; skip rebuilding the state then
+        if available == self._attr_available and value == self._written_value:
+            return
+        self._attr_available = available
+        self._written_value = value
         self.async_write_ha_state()
 
+    def _compute_available(self) -> bool:
+        """Return True if the coordinator has data for this sensor."""
+        data = self.coordinator.data
+        return bool(
+            self.coordinator.last_update_success
+            and data is not None
+            and "previous_race" in data
+        )
+
     @property
     def native_value(self) -> StateType:
         """Return the state of the sensor."""
@@ -181,34 +159,31 @@ class PreviousRaceBaseSensor(SensorEntity):
             )
             return None
 
-        previous_races = data["previous_race"]
-        if not previous_races or not isinstance(previous_races, list):
-            _LOGGER.debug("No valid previous_race list for sensor %s", self._attr_name)
-            return None
-
-        # Find race for this series
-        for race in previous_races:
-            if isinstance(race, dict) and race.get("series_name") == self.series_name:
-                value = self._extract_value(race)
-                _LOGGER.debug(
-                    "Sensor %s found value: %s for series %s",
-                    self._attr_name,
-                    value,
-                    self.series_name,
-                )
-                return value
-
-        _LOGGER.debug(
-            "No race found for series %s in sensor %s. Available series: %s",
-            self.series_name,
-            self._attr_name,
-            [r.get("series_name") for r in previous_races if isinstance(r, dict)],
-        )
+        # Coordinator indexes the race list by series once per fetch
+        races_by_series = data.get("previous_race_by_series", {})
+        race = races_by_series.get(self.series_name)
+        if race is not None:
+            # Each fetch parses fresh race dicts, so an unchanged object means
+            # an unchanged value
+            if race is self._last_race:
+                return self._last_value
+            value = self._extract_value(race)
+            self._last_race = race
+            self._last_value = value
+            return value
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "No race found for series %s in sensor %s. Available series: %s",
+                self.series_name,
+                self._attr_name,
+                list(races_by_series),
+            )
         return None
 
     def _extract_value(self, race_data):
-        """Extract value from race data - to be implemented by subclasses."""
-        raise NotImplementedError
+        """Extract value from race data; override for derived values."""
+        return race_data.get(self._field)
 
 
 class PreviousRaceTrackSensor(PreviousRaceBaseSensor):
@@ -217,9 +192,7 @@ class PreviousRaceTrackSensor(PreviousRaceBaseSensor):
     sensor_type = "track"
     sensor_name = "Track"
     icon = "mdi:map-marker"
-
-    def _extract_value(self, race_data):
-        return race_data.get("track_name")
+    _field = "track_name"
 
 
 class PreviousRaceDateSensor(PreviousRaceBaseSensor):
@@ -233,7 +206,7 @@ class PreviousRaceDateSensor(PreviousRaceBaseSensor):
     def _extract_value(self, race_data):
         date_str = race_data.get("race_date")
         if date_str:
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00")).date()
+            return _parse_timestamp(date_str).date()
         return None
 
 
@@ -243,12 +216,10 @@ class PreviousRaceScheduledDistanceSensor(PreviousRaceBaseSensor):
     sensor_type = "scheduled_distance"
     sensor_name = "Scheduled Distance"
     icon = "mdi:map-marker-distance"
+    _field = "scheduled_distance"
     _attr_native_unit_of_measurement = "miles"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("scheduled_distance")
-
 
 class PreviousRaceScheduledLapsSensor(PreviousRaceBaseSensor):
     """Previous race scheduled laps sensor."""
@@ -256,11 +227,9 @@ class PreviousRaceScheduledLapsSensor(PreviousRaceBaseSensor):
     sensor_type = "scheduled_laps"
     sensor_name = "Scheduled Laps"
     icon = "mdi:counter"
+    _field = "scheduled_laps"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("scheduled_laps")
-
 
 class PreviousRaceCarsSensor(PreviousRaceBaseSensor):
     """Previous race cars sensor."""
@@ -268,11 +237,9 @@ class PreviousRaceCarsSensor(PreviousRaceBaseSensor):
     sensor_type = "cars"
     sensor_name = "Cars in Field"
     icon = "mdi:car-multiple"
+    _field = "cars_in_field"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("cars_in_field")
-
 
 class PreviousRaceTVSensor(PreviousRaceBaseSensor):
     """Previous race TV broadcaster sensor."""
@@ -280,9 +247,7 @@ class PreviousRaceTVSensor(PreviousRaceBaseSensor):
     sensor_type = "tv"
     sensor_name = "TV Broadcaster"
     icon = "mdi:television"
-
-    def _extract_value(self, race_data):
-        return race_data.get("television_broadcaster")
+    _field = "television_broadcaster"
 
 
 class PreviousRaceRadioSensor(PreviousRaceBaseSensor):
@@ -291,9 +256,7 @@ class PreviousRaceRadioSensor(PreviousRaceBaseSensor):
     sensor_type = "radio"
     sensor_name = "Radio Broadcaster"
     icon = "mdi:radio"
-
-    def _extract_value(self, race_data):
-        return race_data.get("radio_broadcaster")
+    _field = "radio_broadcaster"
 
 
 class PreviousRacePlayoffSensor(PreviousRaceBaseSensor):
@@ -302,11 +265,9 @@ class PreviousRacePlayoffSensor(PreviousRaceBaseSensor):
     sensor_type = "playoff"
     sensor_name = "Playoff Round"
     icon = "mdi:trophy"
+    _field = "playoff_round"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("playoff_round")
-
 
 class PreviousRaceWinnerSensor(PreviousRaceBaseSensor):
     """Previous race winner sensor."""
@@ -314,9 +275,7 @@ class PreviousRaceWinnerSensor(PreviousRaceBaseSensor):
     sensor_type = "winner"
     sensor_name = "Winner"
     icon = "mdi:trophy-award"
-
-    def _extract_value(self, race_data):
-        return race_data.get("winner")
+    _field = "winner"
 
 
 class PreviousRaceActualDistanceSensor(PreviousRaceBaseSensor):
@@ -325,12 +284,10 @@ class PreviousRaceActualDistanceSensor(PreviousRaceBaseSensor):
     sensor_type = "actual_distance"
     sensor_name = "Actual Distance"
     icon = "mdi:map-marker-distance"
+    _field = "actual_distance"
     _attr_native_unit_of_measurement = "miles"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("actual_distance")
-
 
 class PreviousRaceActualLapsSensor(PreviousRaceBaseSensor):
     """Previous race actual laps sensor."""
@@ -338,11 +295,9 @@ class PreviousRaceActualLapsSensor(PreviousRaceBaseSensor):
     sensor_type = "actual_laps"
     sensor_name = "Actual Laps"
     icon = "mdi:counter"
+    _field = "actual_laps"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("actual_laps")
-
 
 class PreviousRaceNameSensor(PreviousRaceBaseSensor):
     """Previous race name sensor."""
@@ -350,9 +305,7 @@ class PreviousRaceNameSensor(PreviousRaceBaseSensor):
     sensor_type = "name"
     sensor_name = "Race Name"
     icon = "mdi:flag-checkered"
-
-    def _extract_value(self, race_data):
-        return race_data.get("name")
+    _field = "name"
 
 
 class PreviousRaceTrackTypeSensor(PreviousRaceBaseSensor):
@@ -361,47 +314,79 @@ class PreviousRaceTrackTypeSensor(PreviousRaceBaseSensor):
     sensor_type = "track_type"
     sensor_name = "Track Type"
     icon = "mdi:road-variant"
-
-    def _extract_value(self, race_data):
-        return race_data.get("track_type")
+    _field = "track_type"
 
 
 # Next Race Sensors
+NEXT_SENSORS: list[type[SensorEntity]] = []
+
+
 class NextRaceBaseSensor(SensorEntity):
     """Base class for next race sensors."""
 
+    __slots__ = (
+        "coordinator",
+        "series_name",
+        "_last_race",
+        "_last_value",
+        "_written_value",
+    )
+
+    _attr_should_poll = False
+
+    # Race payload key returned by the default _extract_value
+    _field: str | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Register the sensor and derive its entity constants at class creation."""
+        super().__init_subclass__(**kwargs)
+        NEXT_SENSORS.append(cls)
+        cls._ids_by_series = {
+            name: (
+                f"next_race_{series_slug(name)}_{cls.sensor_type}",
+                f"Next Race {name} {cls.sensor_name}",
+            )
+            for name in SERIES_MAPPING.values()
+        }
+        cls._attr_icon = cls.icon
+
     def __init__(self, coordinator, series_name: str):
         self.coordinator = coordinator
         self.series_name = series_name
-        self._attr_unique_id = (
-            f"next_race_{series_name.lower().replace(' ', '_')}_{self.sensor_type}"
-        )
-        self._attr_name = f"Next Race {series_name} {self.sensor_name}"
-        self._attr_icon = self.icon
+        self._last_race = None
+        self._last_value = None
+        self._written_value = _UNWRITTEN
+        self._attr_unique_id, self._attr_name = self._ids_by_series[series_name]
         self._attr_device_info = get_next_race_device(series_name)
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self.coordinator.data is not None
-            and "next_race" in self.coordinator.data
-        )
+        self._attr_available = self._compute_available()
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
-        self.coordinator.async_add_listener(self._handle_coordinator_update)
-
-    async def async_will_remove_from_hass(self) -> None:
-        """When entity will be removed from hass."""
-        await super().async_will_remove_from_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
+        )
+        self._attr_available = self._compute_available()
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        available = self._compute_available()
+        value = self.native_value
+        if available == self._attr_available and value == self._written_value:
+            return
+        self._attr_available = available
+        self._written_value = value
         self.async_write_ha_state()
 
+    def _compute_available(self) -> bool:
+        """Return True if the coordinator has data for this sensor."""
+        data = self.coordinator.data
+        return bool(
+            self.coordinator.last_update_success
+            and data is not None
+            and "next_race" in data
+        )
+
     @property
     def native_value(self) -> StateType:
         """Return the state of the sensor."""
@@ -410,34 +395,29 @@ class NextRaceBaseSensor(SensorEntity):
             _LOGGER.debug("No next_race data available for sensor %s", self._attr_name)
             return None
 
-        next_races = data["next_race"]
-        if not next_races or not isinstance(next_races, list):
-            _LOGGER.debug("No valid next_race list for sensor %s", self._attr_name)
-            return None
-
-        # Find race for this series
-        for race in next_races:
-            if isinstance(race, dict) and race.get("series_name") == self.series_name:
-                value = self._extract_value(race)
-                _LOGGER.debug(
-                    "Sensor %s found value: %s for series %s",
-                    self._attr_name,
-                    value,
-                    self.series_name,
-                )
-                return value
-
-        _LOGGER.debug(
-            "No race found for series %s in sensor %s. Available series: %s",
-            self.series_name,
-            self._attr_name,
-            [r.get("series_name") for r in next_races if isinstance(r, dict)],
-        )
+        # Coordinator indexes the race list by series once per fetch
+        races_by_series = data.get("next_race_by_series", {})
+        race = races_by_series.get(self.series_name)
+        if race is not None:
+            if race is self._last_race:
+                return self._last_value
+            value = self._extract_value(race)
+            self._last_race = race
+            self._last_value = value
+            return value
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "No race found for series %s in sensor %s. Available series: %s",
+                self.series_name,
+                self._attr_name,
+                list(races_by_series),
+            )
         return None
 
     def _extract_value(self, race_data):
-        """Extract value from race data - to be implemented by subclasses."""
-        raise NotImplementedError
+        """Extract value from race data; override for derived values."""
+        return race_data.get(self._field)
 
 
 class NextRaceTrackSensor(NextRaceBaseSensor):
@@ -446,9 +426,7 @@ class NextRaceTrackSensor(NextRaceBaseSensor):
     sensor_type = "track"
     sensor_name = "Track"
     icon = "mdi:map-marker"
-
-    def _extract_value(self, race_data):
-        return race_data.get("track_name")
+    _field = "track_name"
 
 
 class NextRaceDateSensor(NextRaceBaseSensor):
@@ -462,7 +440,7 @@ class NextRaceDateSensor(NextRaceBaseSensor):
     def _extract_value(self, race_data):
         date_str = race_data.get("scheduled_date")
         if date_str:
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00")).date()
+            return _parse_timestamp(date_str).date()
         return None
 
 
@@ -472,12 +450,10 @@ class NextRaceScheduledDistanceSensor(NextRaceBaseSensor):
     sensor_type = "scheduled_distance"
     sensor_name = "Scheduled Distance"
     icon = "mdi:map-marker-distance"
+    _field = "scheduled_distance"
     _attr_native_unit_of_measurement = "miles"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("scheduled_distance")
-
 
 class NextRaceScheduledLapsSensor(NextRaceBaseSensor):
     """Next race scheduled laps sensor."""
@@ -485,11 +461,9 @@ class NextRaceScheduledLapsSensor(NextRaceBaseSensor):
     sensor_type = "scheduled_laps"
     sensor_name = "Scheduled Laps"
     icon = "mdi:counter"
+    _field = "scheduled_laps"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("scheduled_laps")
-
 
 class NextRaceCarsSensor(NextRaceBaseSensor):
     """Next race cars sensor."""
@@ -497,11 +471,9 @@ class NextRaceCarsSensor(NextRaceBaseSensor):
     sensor_type = "cars"
     sensor_name = "Cars in Field"
     icon = "mdi:car-multiple"
+    _field = "cars_in_field"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("cars_in_field")
-
 
 class NextRaceTVSensor(NextRaceBaseSensor):
     """Next race TV broadcaster sensor."""
@@ -509,9 +481,7 @@ class NextRaceTVSensor(NextRaceBaseSensor):
     sensor_type = "tv"
     sensor_name = "TV Broadcaster"
     icon = "mdi:television"
-
-    def _extract_value(self, race_data):
-        return race_data.get("television_broadcaster")
+    _field = "television_broadcaster"
 
 
 class NextRaceRadioSensor(NextRaceBaseSensor):
@@ -520,9 +490,7 @@ class NextRaceRadioSensor(NextRaceBaseSensor):
     sensor_type = "radio"
     sensor_name = "Radio Broadcaster"
     icon = "mdi:radio"
-
-    def _extract_value(self, race_data):
-        return race_data.get("radio_broadcaster")
+    _field = "radio_broadcaster"
 
 
 class NextRacePlayoffSensor(NextRaceBaseSensor):
@@ -531,11 +499,9 @@ class NextRacePlayoffSensor(NextRaceBaseSensor):
     sensor_type = "playoff"
     sensor_name = "Playoff Round"
     icon = "mdi:trophy"
+    _field = "playoff_round"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("playoff_round")
-
 
 class NextRaceNameSensor(NextRaceBaseSensor):
     """Next race name sensor."""
@@ -543,9 +509,7 @@ class NextRaceNameSensor(NextRaceBaseSensor):
     sensor_type = "name"
     sensor_name = "Race Name"
     icon = "mdi:flag-checkered"
-
-    def _extract_value(self, race_data):
-        return race_data.get("name")
+    _field = "name"
 
 
 class NextRaceTrackTypeSensor(NextRaceBaseSensor):
@@ -554,76 +518,88 @@ class NextRaceTrackTypeSensor(NextRaceBaseSensor):
     sensor_type = "track_type"
     sensor_name = "Track Type"
     icon = "mdi:road-variant"
-
-    def _extract_value(self, race_data):
-        return race_data.get("track_type")
+    _field = "track_type"
 
 
 # Live Race Sensors
+LIVE_SENSORS: list[type[SensorEntity]] = []
+
+
 class LiveRaceBaseSensor(SensorEntity):
     """Base class for live race sensors."""
 
+    __slots__ = ("coordinator", "_last_race", "_last_value", "_written_value")
+
+    _attr_should_poll = False
+
+    _attr_device_info = _LIVE_RACE_DEVICE
+
+    # Race payload key returned by the default _extract_value
+    _field: str | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Register the sensor and derive its entity constants at class creation."""
+        super().__init_subclass__(**kwargs)
+        LIVE_SENSORS.append(cls)
+        cls._attr_unique_id = f"live_race_{cls.sensor_type}"
+        cls._attr_name = f"Live Race {cls.sensor_name}"
+        cls._attr_icon = cls.icon
+
     def __init__(self, coordinator):
         self.coordinator = coordinator
-        self._attr_unique_id = f"live_race_{self.sensor_type}"
-        self._attr_name = f"Live Race {self.sensor_name}"
-        self._attr_icon = self.icon
-        # Always use a single live race device
-        self._attr_device_info = get_live_race_device("live_race", "Live Race")
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self.coordinator.data is not None
-            and "live_race" in self.coordinator.data
-            and isinstance(self.coordinator.data["live_race"], list)
-            and len(self.coordinator.data["live_race"]) > 0
-        )
+        self._last_race = None
+        self._last_value = None
+        self._written_value = _UNWRITTEN
+        self._attr_available = self._compute_available()
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
-        self.coordinator.async_add_listener(self._handle_coordinator_update)
-
-    async def async_will_remove_from_hass(self) -> None:
-        """When entity will be removed from hass."""
-        await super().async_will_remove_from_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
+        )
+        self._attr_available = self._compute_available()
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        available = self._compute_available()
+        value = self.native_value
+        if available == self._attr_available and value == self._written_value:
+            return
+        self._attr_available = available
+        self._written_value = value
         self.async_write_ha_state()
 
+    def _compute_available(self) -> bool:
+        """Return True if the coordinator has data for this sensor."""
+        data = self.coordinator.data
+        return bool(
+            self.coordinator.last_update_success
+            and data is not None
+            and data.get("live_race_current") is not None
+        )
+
     @property
     def native_value(self) -> StateType:
         """Return the state of the sensor."""
+        # The coordinator validates the live race shape and exposes the
+        # current (first) race directly
         data = self.coordinator.data
-        if not data or "live_race" not in data:
-            _LOGGER.debug("No live_race data available for sensor %s", self._attr_name)
-            return STATE_UNAVAILABLE
-
-        live_races = data["live_race"]
-        if not live_races or not isinstance(live_races, list) or len(live_races) == 0:
-            _LOGGER.debug(
-                "No valid live_race data for sensor %s (empty or invalid)",
-                self._attr_name,
-            )
-            return STATE_UNAVAILABLE
-
-        # Get the first live race (assuming one active race at a time)
-        race = live_races[0]
-        if not isinstance(race, dict):
-            _LOGGER.debug("Live race data is not a dict for sensor %s", self._attr_name)
+        race = data.get("live_race_current") if data else None
+        if race is None:
+            _LOGGER.debug("No live race data available for sensor %s", self._attr_name)
             return STATE_UNAVAILABLE
 
+        if race is self._last_race:
+            return self._last_value
         value = self._extract_value(race)
-        _LOGGER.debug("Live sensor %s found value: %s", self._attr_name, value)
+        self._last_race = race
+        self._last_value = value
         return value
 
     def _extract_value(self, race_data):
-        """Extract value from race data - to be implemented by subclasses."""
-        raise NotImplementedError
+        """Extract value from race data; override for derived values."""
+        return race_data.get(self._field)
 
 
 class LiveRaceNameSensor(LiveRaceBaseSensor):
@@ -632,9 +608,7 @@ class LiveRaceNameSensor(LiveRaceBaseSensor):
     sensor_type = "name"
     sensor_name = "Name"
     icon = "mdi:flag-checkered"
-
-    def _extract_value(self, race_data):
-        return race_data.get("name")
+    _field = "name"
 
 
 class LiveRaceTypeSensor(LiveRaceBaseSensor):
@@ -643,9 +617,7 @@ class LiveRaceTypeSensor(LiveRaceBaseSensor):
     sensor_type = "type"
     sensor_name = "Type"
     icon = "mdi:flag-checkered"
-
-    def _extract_value(self, race_data):
-        return race_data.get("type")
+    _field = "type"
 
 
 class LiveRaceStartTimeSensor(LiveRaceBaseSensor):
@@ -659,7 +631,7 @@ class LiveRaceStartTimeSensor(LiveRaceBaseSensor):
     def _extract_value(self, race_data):
         time_str = race_data.get("start_time")
         if time_str:
-            return datetime.fromisoformat(time_str.replace("Z", "+00:00"))
+            return _parse_timestamp(time_str)
         return None
 
 
@@ -674,7 +646,7 @@ class LiveRaceEndTimeSensor(LiveRaceBaseSensor):
     def _extract_value(self, race_data):
         time_str = race_data.get("end_time")
         if time_str:
-            return datetime.fromisoformat(time_str.replace("Z", "+00:00"))
+            return _parse_timestamp(time_str)
         return None
 
 
@@ -684,11 +656,9 @@ class LiveRaceTotalLapsSensor(LiveRaceBaseSensor):
     sensor_type = "total_laps"
     sensor_name = "Total Laps"
     icon = "mdi:counter"
+    _field = "total_laps"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("total_laps")
-
 
 class LiveRaceActualLapsSensor(LiveRaceBaseSensor):
     """Live race actual laps sensor."""
@@ -696,11 +666,9 @@ class LiveRaceActualLapsSensor(LiveRaceBaseSensor):
     sensor_type = "actual_laps"
     sensor_name = "Actual Laps"
     icon = "mdi:counter"
+    _field = "actual_laps"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("actual_laps")
-
 
 class LiveRaceScheduledLapsSensor(LiveRaceBaseSensor):
     """Live race scheduled laps sensor."""
@@ -708,11 +676,9 @@ class LiveRaceScheduledLapsSensor(LiveRaceBaseSensor):
     sensor_type = "scheduled_laps"
     sensor_name = "Scheduled Laps"
     icon = "mdi:counter"
+    _field = "scheduled_laps"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("scheduled_laps")
-
 
 class LiveRaceScheduledDistanceSensor(LiveRaceBaseSensor):
     """Live race scheduled distance sensor."""
@@ -720,12 +686,10 @@ class LiveRaceScheduledDistanceSensor(LiveRaceBaseSensor):
     sensor_type = "scheduled_distance"
     sensor_name = "Scheduled Distance"
     icon = "mdi:map-marker-distance"
+    _field = "scheduled_distance"
     _attr_native_unit_of_measurement = "miles"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("scheduled_distance")
-
 
 class LiveRaceStageLapsSensor(LiveRaceBaseSensor):
     """Live race stage laps sensor."""
@@ -733,11 +697,9 @@ class LiveRaceStageLapsSensor(LiveRaceBaseSensor):
     sensor_type = "stage_laps"
     sensor_name = "Stage Laps"
     icon = "mdi:counter"
+    _field = "stage_laps"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("stage_laps")
-
 
 class LiveRaceStageStartSensor(LiveRaceBaseSensor):
     """Live race stage start sensor."""
@@ -745,11 +707,9 @@ class LiveRaceStageStartSensor(LiveRaceBaseSensor):
     sensor_type = "stage_start"
     sensor_name = "Stage Start"
     icon = "mdi:flag-checkered"
+    _field = "stage_start"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("stage_start")
-
 
 class LiveRaceStageRemainingSensor(LiveRaceBaseSensor):
     """Live race stage remaining sensor."""
@@ -757,11 +717,9 @@ class LiveRaceStageRemainingSensor(LiveRaceBaseSensor):
     sensor_type = "stage_remaining"
     sensor_name = "Stage Remaining"
     icon = "mdi:flag-checkered"
+    _field = "stage_remaining"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("stage_remaining")
-
 
 class LiveRaceStageCompletedSensor(LiveRaceBaseSensor):
     """Live race stage completed sensor."""
@@ -769,11 +727,9 @@ class LiveRaceStageCompletedSensor(LiveRaceBaseSensor):
     sensor_type = "stage_completed"
     sensor_name = "Stage Completed"
     icon = "mdi:flag-checkered"
+    _field = "stage_completed"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("stage_completed")
-
 
 class LiveRaceStageEndSensor(LiveRaceBaseSensor):
     """Live race stage end sensor."""
@@ -781,11 +737,9 @@ class LiveRaceStageEndSensor(LiveRaceBaseSensor):
     sensor_type = "stage_end"
     sensor_name = "Stage End"
     icon = "mdi:flag-checkered"
+    _field = "stage_end"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("stage_end")
-
 
 class LiveRaceTrackSensor(LiveRaceBaseSensor):
     """Live race track sensor."""
@@ -793,9 +747,7 @@ class LiveRaceTrackSensor(LiveRaceBaseSensor):
     sensor_type = "track"
     sensor_name = "Track"
     icon = "mdi:map-marker"
-
-    def _extract_value(self, race_data):
-        return race_data.get("track")
+    _field = "track"
 
 
 class LiveRaceTrackTzSensor(LiveRaceBaseSensor):
@@ -804,9 +756,7 @@ class LiveRaceTrackTzSensor(LiveRaceBaseSensor):
     sensor_type = "track_tz"
     sensor_name = "Track Timezone"
     icon = "mdi:clock-outline"
-
-    def _extract_value(self, race_data):
-        return race_data.get("track_tz")
+    _field = "track_tz"
 
 
 class LiveRaceLatSensor(LiveRaceBaseSensor):
@@ -815,12 +765,10 @@ class LiveRaceLatSensor(LiveRaceBaseSensor):
     sensor_type = "lat"
     sensor_name = "Latitude"
     icon = "mdi:map-marker"
+    _field = "lat"
     _attr_native_unit_of_measurement = "°"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("lat")
-
 
 class LiveRaceLngSensor(LiveRaceBaseSensor):
     """Live race longitude sensor."""
@@ -828,12 +776,10 @@ class LiveRaceLngSensor(LiveRaceBaseSensor):
     sensor_type = "lng"
     sensor_name = "Longitude"
     icon = "mdi:map-marker"
+    _field = "lng"
     _attr_native_unit_of_measurement = "°"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("lng")
-
 
 class LiveRaceTrackTypeSensor(LiveRaceBaseSensor):
     """Live race track type sensor."""
@@ -841,9 +787,7 @@ class LiveRaceTrackTypeSensor(LiveRaceBaseSensor):
     sensor_type = "track_type"
     sensor_name = "Track Type"
     icon = "mdi:map-marker"
-
-    def _extract_value(self, race_data):
-        return race_data.get("track_type")
+    _field = "track_type"
 
 
 class LiveRaceLapNumberSensor(LiveRaceBaseSensor):
@@ -852,11 +796,9 @@ class LiveRaceLapNumberSensor(LiveRaceBaseSensor):
     sensor_type = "lap_number"
     sensor_name = "Lap Number"
     icon = "mdi:counter"
+    _field = "lap_number"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("lap_number")
-
 
 class LiveRaceFlagSensor(LiveRaceBaseSensor):
     """Live race flag sensor."""
@@ -867,7 +809,9 @@ class LiveRaceFlagSensor(LiveRaceBaseSensor):
 
     def _extract_value(self, race_data):
         flag_code = race_data.get("flag")
-        return FLAG_MAPPING.get(flag_code, f"Unknown ({flag_code})")
+        flag = FLAG_MAPPING.get(flag_code)
+        # Only format the fallback for codes we don't know
+        return flag if flag is not None else f"Unknown ({flag_code})"
 
 
 class LiveRaceCurrentStageSensor(LiveRaceBaseSensor):
@@ -876,9 +820,7 @@ class LiveRaceCurrentStageSensor(LiveRaceBaseSensor):
     sensor_type = "current_stage"
     sensor_name = "Current Stage"
     icon = "mdi:flag-checkered"
-
-    def _extract_value(self, race_data):
-        return race_data.get("current_stage")
+    _field = "current_stage"
 
 
 class LiveRaceLapsRemainingSensor(LiveRaceBaseSensor):
@@ -887,11 +829,9 @@ class LiveRaceLapsRemainingSensor(LiveRaceBaseSensor):
     sensor_type = "laps_remaining"
     sensor_name = "Laps Remaining"
     icon = "mdi:counter"
+    _field = "laps_remaining"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("laps_remaining")
-
 
 class LiveRaceElapsedTimeSensor(LiveRaceBaseSensor):
     """Live race elapsed time sensor."""
@@ -899,12 +839,10 @@ class LiveRaceElapsedTimeSensor(LiveRaceBaseSensor):
     sensor_type = "elapsed_time"
     sensor_name = "Elapsed Time"
     icon = "mdi:timer"
+    _field = "elapsed_time"
     _attr_native_unit_of_measurement = "s"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("elapsed_time")
-
 
 class LiveRaceLengthSensor(LiveRaceBaseSensor):
     """Live race length sensor."""
@@ -912,12 +850,10 @@ class LiveRaceLengthSensor(LiveRaceBaseSensor):
     sensor_type = "length"
     sensor_name = "Length"
     icon = "mdi:map-marker-distance"
+    _field = "scheduled_distance"
     _attr_native_unit_of_measurement = "miles"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("scheduled_distance")
-
 
 class LiveRaceSeriesSensor(LiveRaceBaseSensor):
     """Live race series sensor."""
@@ -928,7 +864,8 @@ class LiveRaceSeriesSensor(LiveRaceBaseSensor):
 
     def _extract_value(self, race_data):
         series_id = race_data.get("series")
-        return SERIES_MAPPING.get(series_id, f"Unknown ({series_id})")
+        series = SERIES_MAPPING.get(series_id)
+        return series if series is not None else f"Unknown ({series_id})"
 
 
 class LiveRacePitStopDeltaSensor(LiveRaceBaseSensor):
@@ -937,12 +874,10 @@ class LiveRacePitStopDeltaSensor(LiveRaceBaseSensor):
     sensor_type = "pit_stop_delta"
     sensor_name = "Pit Stop Delta"
     icon = "mdi:timer-sand"
+    _field = "pit_stop_delta"
     _attr_native_unit_of_measurement = "s"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("pit_stop_delta")
-
 
 class LiveRaceActualDistanceSensor(LiveRaceBaseSensor):
     """Live race actual distance sensor."""
@@ -950,12 +885,10 @@ class LiveRaceActualDistanceSensor(LiveRaceBaseSensor):
     sensor_type = "actual_distance"
     sensor_name = "Actual Distance"
     icon = "mdi:map-marker-distance"
+    _field = "actual_distance"
     _attr_native_unit_of_measurement = "miles"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, race_data):
-        return race_data.get("actual_distance")
-
 
 class LiveRaceCautionCountSensor(LiveRaceBaseSensor):
     """Live race caution count sensor."""
@@ -978,56 +911,64 @@ class LiveRaceCautionCountSensor(LiveRaceBaseSensor):
 class VehiclePositionSensor(SensorEntity):
     """Sensor for a specific running position in the live race."""
 
+    __slots__ = (
+        "coordinator",
+        "_position",
+        "_last_vehicle",
+        "_last_attrs",
+        "_written_vehicle",
+    )
+
+    _attr_should_poll = False
+
+    _attr_device_info = _LIVE_RACE_DEVICE
+    _attr_icon = "mdi:podium"
+
     def __init__(self, coordinator, position: int):
         self.coordinator = coordinator
         self._position = position
-        self._attr_unique_id = f"live_race_position_{position}"
-        self._attr_name = f"Live Race Position {position}"
-        self._attr_icon = "mdi:podium"
-        self._attr_device_info = get_live_race_device("live_race", "Live Race")
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return (
+        self._last_vehicle = None
+        self._last_attrs = None
+        self._written_vehicle = _UNWRITTEN
+        self._attr_unique_id, self._attr_name = _position_ids(position)
+        self._attr_available = self._compute_available()
+
+    def _compute_available(self) -> bool:
+        """Return True if the coordinator has a live race with vehicles."""
+        data = self.coordinator.data
+        return bool(
             self.coordinator.last_update_success
-            and self.coordinator.data is not None
-            and "live_race" in self.coordinator.data
-            and isinstance(self.coordinator.data["live_race"], list)
-            and len(self.coordinator.data["live_race"]) > 0
-            and "vehicle_list" in self.coordinator.data
-            and isinstance(self.coordinator.data["vehicle_list"], list)
-            and len(self.coordinator.data["vehicle_list"]) > 0
+            and data is not None
+            and data.get("live_race_current") is not None
+            and data.get("vehicle_list")
         )
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
-        self.coordinator.async_add_listener(self._handle_coordinator_update)
-
-    async def async_will_remove_from_hass(self) -> None:
-        """When entity will be removed from hass."""
-        await super().async_will_remove_from_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
+        )
+        self._attr_available = self._compute_available()
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        available = self._compute_available()
+        vehicle = self._find_vehicle_at_position()
+        # Weather and race-only updates leave this position's vehicle untouched
+        if available == self._attr_available and vehicle is self._written_vehicle:
+            return
+        self._attr_available = available
+        self._written_vehicle = vehicle
         self.async_write_ha_state()
 
     def _find_vehicle_at_position(self) -> dict | None:
         """Find the vehicle at this position."""
         data = self.coordinator.data
-        if not data or "vehicle_list" not in data:
+        if not data:
             return None
-        vehicles = data["vehicle_list"]
-        if not isinstance(vehicles, list):
-            return None
-        for vehicle in vehicles:
-            if (
-                isinstance(vehicle, dict)
-                and vehicle.get("running_position") == self._position
-            ):
-                return vehicle
-        return None
+        # Coordinator indexes the vehicle list by running position once per update
+        return data.get("vehicle_list_by_position", {}).get(self._position)
 
     @property
     def native_value(self) -> StateType:
@@ -1041,63 +982,97 @@ class VehiclePositionSensor(SensorEntity):
     def extra_state_attributes(self) -> dict | None:
         """Return vehicle details as extra attributes."""
         vehicle = self._find_vehicle_at_position()
-        if vehicle:
-            return {
+        if not vehicle:
+            return None
+        # Each vehicle_list snapshot carries fresh dicts, so reuse the attributes
+        # until this position's vehicle object changes
+        if vehicle is not self._last_vehicle:
+            self._last_attrs = {
                 "vehicle_number": vehicle.get("vehicle_number"),
                 "team_name": vehicle.get("team_name"),
                 "manufacturer": vehicle.get("manufacturer"),
                 "sponsor": vehicle.get("sponsor"),
             }
-        return None
+            self._last_vehicle = vehicle
+        return self._last_attrs
 
 
 # Weather Sensors
+WEATHER_SENSORS: list[type[SensorEntity]] = []
+
+
 class WeatherBaseSensor(SensorEntity):
     """Base class for track weather sensors."""
 
+    __slots__ = ("coordinator", "_last_weather", "_last_value", "_written_value")
+
+    _attr_should_poll = False
+
+    _attr_device_info = _LIVE_RACE_DEVICE
+
+    # Key under the payload's "current" block returned by the default _extract_value
+    _field: str | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Register the sensor and derive its entity constants at class creation."""
+        super().__init_subclass__(**kwargs)
+        WEATHER_SENSORS.append(cls)
+        cls._attr_unique_id = f"live_race_weather_{cls.sensor_type}"
+        cls._attr_name = f"Track Weather {cls.sensor_name}"
+        cls._attr_icon = cls.icon
+
     def __init__(self, coordinator):
         self.coordinator = coordinator
-        self._attr_unique_id = f"live_race_weather_{self.sensor_type}"
-        self._attr_name = f"Track Weather {self.sensor_name}"
-        self._attr_icon = self.icon
-        self._attr_device_info = get_live_race_device("live_race", "Live Race")
+        self._last_weather = None
+        self._last_value = None
+        self._written_value = _UNWRITTEN
+        self._attr_available = self._compute_available()
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return (
+    def _compute_available(self) -> bool:
+        """Return True if the coordinator has weather for a live race."""
+        data = self.coordinator.data
+        return bool(
             self.coordinator.last_update_success
-            and self.coordinator.data is not None
-            and "live_race" in self.coordinator.data
-            and isinstance(self.coordinator.data["live_race"], list)
-            and len(self.coordinator.data["live_race"]) > 0
-            and self.coordinator.data.get("weather") is not None
+            and data is not None
+            and data.get("live_race_current") is not None
+            and data.get("weather") is not None
         )
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
-        self.coordinator.async_add_listener(self._handle_coordinator_update)
-
-    async def async_will_remove_from_hass(self) -> None:
-        """When entity will be removed from hass."""
-        await super().async_will_remove_from_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
+        )
+        self._attr_available = self._compute_available()
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        available = self._compute_available()
+        value = self.native_value
+        if available == self._attr_available and value == self._written_value:
+            return
+        self._attr_available = available
+        self._written_value = value
         self.async_write_ha_state()
 
     @property
     def native_value(self) -> StateType:
         """Return the weather value."""
         data = self.coordinator.data
-        if not data or not data.get("weather"):
+        weather = data.get("weather") if data else None
+        if not weather:
             return None
-        return self._extract_value(data["weather"])
+        # The coordinator keeps the same weather dict until the next fetch
+        if weather is not self._last_weather:
+            self._last_value = self._extract_value(weather)
+            self._last_weather = weather
+        return self._last_value
 
     def _extract_value(self, weather_data):
-        """Extract value from weather data - to be implemented by subclasses."""
-        raise NotImplementedError
+        """Extract value from weather data; override for derived values."""
+        current = weather_data.get("current")
+        return current.get(self._field) if current else None
 
 
 class WeatherTemperatureSensor(WeatherBaseSensor):
@@ -1106,14 +1081,11 @@ class WeatherTemperatureSensor(WeatherBaseSensor):
     sensor_type = "temperature"
     sensor_name = "Temperature"
     icon = "mdi:thermometer"
+    _field = "temp"
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_native_unit_of_measurement = UnitOfTemperature.FAHRENHEIT
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, weather_data):
-        current = weather_data.get("current", {})
-        return current.get("temp")
-
 
 class WeatherHumiditySensor(WeatherBaseSensor):
     """Track humidity sensor."""
@@ -1121,14 +1093,11 @@ class WeatherHumiditySensor(WeatherBaseSensor):
     sensor_type = "humidity"
     sensor_name = "Humidity"
     icon = "mdi:water-percent"
+    _field = "humidity"
     _attr_device_class = SensorDeviceClass.HUMIDITY
     _attr_native_unit_of_measurement = "%"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, weather_data):
-        current = weather_data.get("current", {})
-        return current.get("humidity")
-
 
 class WeatherWindSpeedSensor(WeatherBaseSensor):
     """Track wind speed sensor."""
@@ -1136,14 +1105,11 @@ class WeatherWindSpeedSensor(WeatherBaseSensor):
     sensor_type = "wind_speed"
     sensor_name = "Wind Speed"
     icon = "mdi:weather-windy"
+    _field = "wind_speed"
     _attr_device_class = SensorDeviceClass.WIND_SPEED
     _attr_native_unit_of_measurement = UnitOfSpeed.MILES_PER_HOUR
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, weather_data):
-        current = weather_data.get("current", {})
-        return current.get("wind_speed")
-
 
 class WeatherWindDirectionSensor(WeatherBaseSensor):
     """Track wind direction sensor."""
@@ -1151,13 +1117,10 @@ class WeatherWindDirectionSensor(WeatherBaseSensor):
     sensor_type = "wind_direction"
     sensor_name = "Wind Direction"
     icon = "mdi:compass"
+    _field = "wind_deg"
     _attr_native_unit_of_measurement = "°"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _extract_value(self, weather_data):
-        current = weather_data.get("current", {})
-        return current.get("wind_deg")
-
 
 class WeatherRainChanceSensor(WeatherBaseSensor):
     """Track rain chance sensor (next hour precipitation probability)."""
@@ -1184,9 +1147,9 @@ class WeatherConditionsSensor(WeatherBaseSensor):
     icon = "mdi:weather-partly-cloudy"
 
     def _extract_value(self, weather_data):
-        current = weather_data.get("current", {})
-        weather_list = current.get("weather", [])
-        if weather_list and isinstance(weather_list, list) and len(weather_list) > 0:
+        current = weather_data.get("current")
+        weather_list = current.get("weather") if current else None
+        if weather_list and isinstance(weather_list, list):
             return weather_list[0].get("main")
         return None
 
@@ -1195,6 +1158,11 @@ class WeatherConditionsSensor(WeatherBaseSensor):
 class BackendVersionSensor(SensorEntity):
     """Backend version diagnostic sensor."""
 
+    __slots__ = ("coordinator", "_written_config", "_last_config", "_last_attrs")
+
+    _attr_should_poll = False
+
+    _attr_device_info = get_live_status_device()
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
     def __init__(self, coordinator):
@@ -1202,24 +1170,36 @@ class BackendVersionSensor(SensorEntity):
         self._attr_unique_id = "galaxie_backend_version"
         self._attr_name = "Galaxie Backend Version"
         self._attr_icon = "mdi:information-outline"
-        self._attr_device_info = get_live_status_device()
+        self._written_config = _UNWRITTEN
+        self._last_config = None
+        self._last_attrs = None
+        self._attr_available = self._compute_available()
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return (
+    def _compute_available(self) -> bool:
+        """Return True if the coordinator has backend config."""
+        data = self.coordinator.data
+        return bool(
             self.coordinator.last_update_success
-            and self.coordinator.data is not None
-            and self.coordinator.data.get("config") is not None
+            and data is not None
+            and data.get("config") is not None
         )
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
-        self.coordinator.async_add_listener(self._handle_coordinator_update)
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
+        )
+        self._attr_available = self._compute_available()
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        available = self._compute_available()
+        config = self.coordinator.data.get("config") if self.coordinator.data else None
+        if available == self._attr_available and config is self._written_config:
+            return
+        self._attr_available = available
+        self._written_config = config
         self.async_write_ha_state()
 
     @property
@@ -1234,10 +1214,13 @@ class BackendVersionSensor(SensorEntity):
     def extra_state_attributes(self) -> dict | None:
         """Return additional config attributes."""
         config = self.coordinator.data.get("config") if self.coordinator.data else None
-        if config:
-            return {
+        if not config:
+            return None
+        if config is not self._last_config:
+            self._last_attrs = {
                 "environment": config.get("environment"),
                 "timezone": config.get("timezone"),
                 "websockets_enabled": config.get("websockets_enabled"),
             }
-        return None
+            self._last_config = config
+        return self._last_attrs
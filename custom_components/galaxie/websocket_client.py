@@ -9,6 +9,8 @@ relied on:
 * ``on_run_detail(dict)``   — fired for each ``run_detail`` publication
 * ``on_vehicle_list(list)`` — fired for each ``vehicle_list`` publication
 * ``on_disconnect()``       — fired once after ``stop()`` (or a final failure)
+* ``on_connection_lost()``  — optional; fired when the socket drops while
+  centrifuge-python retries (or gives up) without ``stop()`` being called
 
 All other publication types (``vehicle_laps``, ``pit_stops``,
 ``driver_results``, etc.) are silently ignored, matching prior behaviour.
@@ -39,6 +41,16 @@ from .const import BASE_URL, CENTRIFUGO_TOKEN_PATH, CENTRIFUGO_WS_PATH, WS_BASE_
 
 _LOGGER = logging.getLogger(__name__)
 
+# centrifuge-python reconnects with full-jitter exponential backoff. Its 100 ms
+# floor sends every install back at a restarting backend almost at once, so
+# start at a second and cap at a minute (seconds).
+WS_MIN_RECONNECT_DELAY = 1.0
+WS_MAX_RECONNECT_DELAY = 60.0
+
+# Token endpoint statuses that retrying cannot fix; raising UnauthorizedError
+# for these makes centrifuge-python stop reconnecting instead of backing off.
+_PERMANENT_TOKEN_STATUSES = (401, 403, 404)
+
 
 class GalaxieWebSocketClient:
     """Manages a Centrifugo subscription for a single live run."""
@@ -51,14 +63,19 @@ class GalaxieWebSocketClient:
         on_vehicle_list: Callable[[list], None],
         on_disconnect: Callable[[], None],
         *,
+        on_connection_lost: Callable[[], None] | None = None,
         ws_base_url: str = WS_BASE_URL,
         api_base_url: str = BASE_URL,
     ) -> None:
         self._session = session
         self._run_id = run_id
-        self._on_run_detail = on_run_detail
-        self._on_vehicle_list = on_vehicle_list
         self._on_disconnect = on_disconnect
+        self._on_connection_lost = on_connection_lost
+        # Publication type -> (required payload type, callback)
+        self._dispatch: dict[str, tuple[type, Callable[[Any], None]]] = {
+            "run_detail": (dict, on_run_detail),
+            "vehicle_list": (list, on_vehicle_list),
+        }
         self._ws_url = f"{ws_base_url}{CENTRIFUGO_WS_PATH}"
         self._token_url = f"{api_base_url}{CENTRIFUGO_TOKEN_PATH}"
         self._channel = f"run:{run_id}"
@@ -68,6 +85,12 @@ class GalaxieWebSocketClient:
         self._connected = False
         self._closing = False
         self._disconnect_fired = False
+        # Only the first connect/subscribe of a run is logged at INFO; a flaky
+        # network would otherwise repeat both lines on every reconnect.
+        self._has_connected = False
+        self._has_subscribed = False
+        # The event loop only keeps weak references to tasks
+        self._start_tasks: set[asyncio.Task] = set()
 
     @property
     def connected(self) -> bool:
@@ -83,12 +106,13 @@ class GalaxieWebSocketClient:
         """Fetch a short-lived Centrifugo JWT from the Galaxie backend.
 
         The token endpoint is public (anonymous users are allowed) so no
-        auth headers are required. Raises ``UnauthorizedError`` on 401/403
-        so centrifuge-python treats it as a terminal auth failure.
+        auth headers are required. Raises ``UnauthorizedError`` on 401/403/404
+        so centrifuge-python treats it as a terminal failure; the coordinator
+        then keeps polling live data over REST.
         """
         try:
             async with self._session.post(self._token_url) as response:
-                if response.status in (401, 403):
+                if response.status in _PERMANENT_TOKEN_STATUSES:
                     raise UnauthorizedError()
                 if response.status != 200:
                     raise RuntimeError(
@@ -109,15 +133,15 @@ class GalaxieWebSocketClient:
         """Route a single publication envelope to the appropriate callback."""
         if not isinstance(data, dict):
             return
-        msg_type = data.get("type")
-        payload = data.get("data")
-        if payload is None:
+        # Other types (Arrow-encoded vehicle_laps, pit_stops, etc.) are ignored
+        # before their payload is touched.
+        route = self._dispatch.get(data.get("type"))
+        if route is None:
             return
-        if msg_type == "run_detail" and isinstance(payload, dict):
-            self._on_run_detail(payload)
-        elif msg_type == "vehicle_list" and isinstance(payload, list):
-            self._on_vehicle_list(payload)
-        # All other types (Arrow-encoded vehicle_laps, pit_stops, etc.) ignored.
+        payload_type, callback = route
+        payload = data.get("data")
+        if isinstance(payload, payload_type):
+            callback(payload)
 
     def _build_client_events(self) -> ClientEventHandler:
         client_self = self
@@ -125,9 +149,12 @@ class GalaxieWebSocketClient:
         class _ClientEvents(ClientEventHandler):
             async def on_connected(self, ctx: ConnectedContext) -> None:
                 client_self._connected = True
-                _LOGGER.info(
-                    "Centrifugo connected for run %s", client_self._run_id
+                _LOGGER.log(
+                    logging.DEBUG if client_self._has_connected else logging.INFO,
+                    "Centrifugo connected for run %s",
+                    client_self._run_id,
                 )
+                client_self._has_connected = True
 
             async def on_disconnected(self, ctx: DisconnectedContext) -> None:
                 client_self._connected = False
@@ -136,6 +163,10 @@ class GalaxieWebSocketClient:
                     client_self._run_id,
                     getattr(ctx, "reason", ""),
                 )
+                # stop() reports through on_disconnect; this is for drops the
+                # caller didn't ask for.
+                if not client_self._closing and client_self._on_connection_lost:
+                    client_self._on_connection_lost()
 
         return _ClientEvents()
 
@@ -149,7 +180,12 @@ class GalaxieWebSocketClient:
                 )
 
             async def on_subscribed(self, ctx: SubscribedContext) -> None:
-                _LOGGER.info("Centrifugo subscribed to %s", client_self._channel)
+                _LOGGER.log(
+                    logging.DEBUG if client_self._has_subscribed else logging.INFO,
+                    "Centrifugo subscribed to %s",
+                    client_self._channel,
+                )
+                client_self._has_subscribed = True
 
             async def on_unsubscribed(self, ctx: UnsubscribedContext) -> None:
                 _LOGGER.info(
@@ -171,17 +207,25 @@ class GalaxieWebSocketClient:
         return _SubEvents()
 
     def start(self) -> None:
-        """Open the Centrifugo connection and subscribe to the run channel."""
+        """Open the Centrifugo connection and subscribe to the run channel.
+
+        Safe to call repeatedly: once a client exists further calls return
+        without scheduling anything.
+        """
         if self._client is not None:
             return
         self._closing = False
         self._disconnect_fired = False
+        self._has_connected = False
+        self._has_subscribed = False
 
         self._client = Client(
             self._ws_url,
             events=self._build_client_events(),
             get_token=self._get_token,
             use_protobuf=False,
+            min_reconnect_delay=WS_MIN_RECONNECT_DELAY,
+            max_reconnect_delay=WS_MAX_RECONNECT_DELAY,
         )
         self._sub = self._client.new_subscription(
             self._channel,
@@ -191,25 +235,21 @@ class GalaxieWebSocketClient:
         # centrifuge-python `connect()` / `subscribe()` are awaitables that
         # kick off background asyncio tasks. Schedule them without awaiting —
         # the coordinator calls `start()` from sync context.
-        asyncio.create_task(self._sub.subscribe())
-        asyncio.create_task(self._client.connect())
+        for coro in (self._sub.subscribe(), self._client.connect()):
+            task = asyncio.create_task(coro)
+            self._start_tasks.add(task)
+            task.add_done_callback(self._start_tasks.discard)
 
     async def stop(self) -> None:
         """Gracefully disconnect from Centrifugo."""
         self._closing = True
         client = self._client
-        sub = self._sub
         self._client = None
         self._sub = None
         self._connected = False
 
-        if sub is not None:
-            try:
-                await sub.unsubscribe()
-            except Exception:  # noqa: BLE001 — best-effort teardown
-                _LOGGER.debug(
-                    "Error unsubscribing from %s", self._channel, exc_info=True
-                )
+        # Closing the connection drops its subscriptions server-side, so an
+        # explicit unsubscribe would only add a command round trip.
         if client is not None:
             try:
                 await client.disconnect()
@@ -220,6 +260,13 @@ class GalaxieWebSocketClient:
                     exc_info=True,
                 )
 
+        # The flag is set first so a callback that restarts this client can't
+        # fire on_disconnect a second time.
         if not self._disconnect_fired:
             self._disconnect_fired = True
-            self._on_disconnect()
+            try:
+                self._on_disconnect()
+            except Exception:
+                _LOGGER.exception(
+                    "Error in on_disconnect callback for run %s", self._run_id
+                )
@@ -0,0 +1,50 @@
+"""Shared test helpers for the Galaxie integration."""
+
+import json
+from unittest.mock import MagicMock
+
+
+class FakeResponse:
+    """Minimal stand-in for an aiohttp response."""
+
+    def __init__(self, status, json_data, headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self._body = json.dumps(json_data).encode()
+
+    async def read(self):
+        return self._body
+
+
+class FakeRequestContext:
+    """Async context manager returned by a fake ``session.get``."""
+
+    def __init__(self, response):
+        self._response = response
+
+    async def __aenter__(self):
+        return self._response
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+def make_mock_session(responses):
+    """Create a mock session that returns different responses per call.
+
+    Args:
+        responses: list of (status, json_data) or (status, json_data, headers)
+            tuples. The last entry is repeated once the list runs out.
+    """
+    call_count = 0
+
+    def make_context_manager(*args, **kwargs):
+        nonlocal call_count
+        idx = min(call_count, len(responses) - 1)
+        call_count += 1
+        return FakeRequestContext(FakeResponse(*responses[idx]))
+
+    mock_session = MagicMock()
+    # Keep get a MagicMock so tests can assert on call_count/call_args_list.
+    mock_session.get = MagicMock(side_effect=make_context_manager)
+    return mock_session
@@ -1,13 +1,15 @@
 """Test configuration for the Galaxie integration."""
 
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 
+from custom_components.galaxie.coordinator import GalaxieDataCoordinator
+
 
 @pytest.fixture
 def mock_coordinator():
     """Create a mock coordinator for testing."""
-    from unittest.mock import MagicMock
-
     coordinator = MagicMock()
     coordinator.data = {
         "previous_race": [],
@@ -19,3 +21,13 @@ def mock_coordinator():
     coordinator.async_add_listener = MagicMock()
     coordinator.backend_version = "2026.02.25"
     return coordinator
+
+
+@pytest.fixture
+def coordinator_factory():
+    """Build coordinators on a given session with mocked HA internals."""
+    hass = AsyncMock()
+    # Drop scheduled coroutines instead of leaving them un-awaited
+    hass.async_create_task = MagicMock(side_effect=lambda target, **kw: target.close())
+    with patch("homeassistant.helpers.frame.report_usage", MagicMock()):
+        yield lambda session: GalaxieDataCoordinator(hass, session)
@@ -1,56 +1,20 @@
 """Test the Galaxie coordinator."""
 
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
-from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+import time
+from datetime import timedelta
 
-from custom_components.galaxie.coordinator import GalaxieDataCoordinator
+from custom_components.galaxie.coordinator import races_by_series
 
-
-def _make_mock_session(responses):
-    """Create a mock session that returns different responses per call.
-
-    Args:
-        responses: list of (status, json_data) tuples.
-    """
-    mock_session = AsyncMock()
-    call_count = 0
-
-    def make_context_manager(*args, **kwargs):
-        nonlocal call_count
-        idx = min(call_count, len(responses) - 1)
-        status, json_data = responses[idx]
-        call_count += 1
-
-        mock_response = AsyncMock()
-        mock_response.status = status
-        mock_response.json = AsyncMock(return_value=json_data)
-
-        cm = AsyncMock()
-        cm.__aenter__ = AsyncMock(return_value=mock_response)
-        cm.__aexit__ = AsyncMock(return_value=False)
-        return cm
-
-    mock_session.get = MagicMock(side_effect=make_context_manager)
-    return mock_session
-
-
-def _make_coordinator(mock_session):
-    """Create a coordinator with mocked HA internals."""
-    mock_hass = AsyncMock()
-    with patch(
-        "homeassistant.helpers.frame.report_usage",
-        MagicMock(),
-    ):
-        coordinator = GalaxieDataCoordinator(mock_hass, mock_session)
-    return coordinator
+from .common import make_mock_session
 
 
 @pytest.mark.asyncio
-async def test_coordinator_initialization():
+async def test_coordinator_initialization(coordinator_factory):
     """Test coordinator initialization."""
     mock_session = AsyncMock()
-    coordinator = _make_coordinator(mock_session)
+    coordinator = coordinator_factory(mock_session)
 
     assert coordinator is not None
     assert coordinator.session == mock_session
@@ -60,16 +24,16 @@ async def test_coordinator_initialization():
 
 
 @pytest.mark.asyncio
-async def test_coordinator_update_data():
+async def test_coordinator_update_data(coordinator_factory):
     """Test coordinator data update includes config on first call."""
-    mock_session = _make_mock_session([
+    mock_session = make_mock_session([
         (200, [{"id": 1, "name": "Test Race"}]),  # previous_race
         (200, [{"id": 2, "name": "Next Race"}]),  # next_race
         (200, []),  # live_race (empty)
         (200, {"version": "2026.02.25", "environment": "production"}),  # config
     ])
 
-    coordinator = _make_coordinator(mock_session)
+    coordinator = coordinator_factory(mock_session)
 
     data = await coordinator._async_update_data()
 
@@ -83,21 +47,19 @@ async def test_coordinator_update_data():
 
 
 @pytest.mark.asyncio
-async def test_coordinator_config_cached():
+async def test_coordinator_config_cached(coordinator_factory):
     """Test that config is cached and not re-fetched on subsequent calls."""
-    mock_session = _make_mock_session([
+    mock_session = make_mock_session([
         # First call: 4 endpoints (including config)
         (200, []),  # previous_race
         (200, []),  # next_race
         (200, []),  # live_race
         (200, {"version": "2026.02.25", "environment": "production"}),  # config
-        # Second call: only 3 endpoints (config cached)
-        (200, []),  # previous_race
-        (200, []),  # next_race
+        # Second call: only live (previous/next and config cached)
         (200, []),  # live_race
     ])
 
-    coordinator = _make_coordinator(mock_session)
+    coordinator = coordinator_factory(mock_session)
 
     # First update: should fetch config
     data1 = await coordinator._async_update_data()
@@ -108,52 +70,188 @@ async def test_coordinator_config_cached():
     # Second update: should NOT fetch config (cached)
     data2 = await coordinator._async_update_data()
     assert data2["config"]["version"] == "2026.02.25"
-    assert mock_session.get.call_count == 7  # 4 + 3 (no config re-fetch)
+    assert mock_session.get.call_count == 5  # 4 + live only
 
 
 @pytest.mark.asyncio
-async def test_coordinator_config_refetch_after_expiry():
+async def test_coordinator_config_refetch_after_expiry(coordinator_factory):
     """Test that config is re-fetched after the cache interval expires."""
-    mock_session = _make_mock_session([
+    mock_session = make_mock_session([
         # First call
         (200, []),  # previous_race
         (200, []),  # next_race
         (200, []),  # live_race
         (200, {"version": "2026.02.25", "environment": "production"}),  # config
-        # Second call (after expiry): 4 endpoints again
-        (200, []),  # previous_race
-        (200, []),  # next_race
+        # Second call (after config expiry): live + config
         (200, []),  # live_race
         (200, {"version": "2026.02.26", "environment": "production"}),  # config (new)
     ])
 
-    coordinator = _make_coordinator(mock_session)
+    coordinator = coordinator_factory(mock_session)
 
     # First update
     await coordinator._async_update_data()
     assert coordinator.backend_version == "2026.02.25"
 
     # Simulate cache expiry by backdating the timestamp
-    coordinator._last_config_fetch = datetime.now() - timedelta(hours=2)
+    coordinator._last_config_fetch = time.monotonic() - 7200
 
     # Second update: should re-fetch config
     data2 = await coordinator._async_update_data()
     assert data2["config"]["version"] == "2026.02.26"
     assert coordinator.backend_version == "2026.02.26"
-    assert mock_session.get.call_count == 8  # 4 + 4
+    assert mock_session.get.call_count == 6  # 4 + 2
+
+
+@pytest.mark.asyncio
+async def test_coordinator_previous_next_cached(coordinator_factory):
+    """Test previous/next races are served from cache until their interval expires."""
+    mock_session = make_mock_session([
+        # First call
+        (200, [{"id": 1}]),  # previous_race
+        (200, [{"id": 2}]),  # next_race
+        (200, []),  # live_race
+        (200, {"version": "2026.02.25", "environment": "production"}),  # config
+        # Second call: live only
+        (200, []),  # live_race
+        # Third call (after expiry): previous, next, live
+        (200, [{"id": 3}]),  # previous_race
+        (200, [{"id": 4}]),  # next_race
+        (200, []),  # live_race
+    ])
+
+    coordinator = coordinator_factory(mock_session)
+
+    await coordinator._async_update_data()
+    data2 = await coordinator._async_update_data()
+    assert data2["previous_race"] == [{"id": 1}]
+    assert data2["next_race"] == [{"id": 2}]
+    assert mock_session.get.call_count == 5
+
+    coordinator._last_prev_next_fetch = time.monotonic() - 1200
+
+    data3 = await coordinator._async_update_data()
+    assert data3["previous_race"] == [{"id": 3}]
+    assert data3["next_race"] == [{"id": 4}]
+    assert mock_session.get.call_count == 8
+
+
+@pytest.mark.asyncio
+async def test_coordinator_previous_next_not_modified(coordinator_factory):
+    """Test a 304 reuses the cached body and the last validators are sent."""
+    mock_session = make_mock_session([
+        # First call
+        (200, [{"id": 1}], {"ETag": '"prev-1"'}),  # previous_race
+        (200, [{"id": 2}], {"Last-Modified": "Sun, 01 Mar 2026 18:00:00 GMT"}),
+        (200, []),  # live_race
+        (200, {"version": "2026.02.25", "environment": "production"}),  # config
+        # Second call (after expiry): previous/next unchanged
+        (304, None),  # previous_race
+        (304, None),  # next_race
+        (200, []),  # live_race
+    ])
+
+    coordinator = coordinator_factory(mock_session)
+
+    await coordinator._async_update_data()
+    coordinator._last_prev_next_fetch = time.monotonic() - 1200
+    data = await coordinator._async_update_data()
+
+    assert data["previous_race"] == [{"id": 1}]
+    assert data["next_race"] == [{"id": 2}]
+    prev_call, next_call = mock_session.get.call_args_list[4:6]
+    assert prev_call.kwargs["headers"]["If-None-Match"] == '"prev-1"'
+    assert (
+        next_call.kwargs["headers"]["If-Modified-Since"]
+        == "Sun, 01 Mar 2026 18:00:00 GMT"
+    )
+
+
+@pytest.mark.asyncio
+async def test_live_race_kept_on_fetch_failure(coordinator_factory):
+    """Test a failed live fetch keeps the last good live race list."""
+    mock_session = make_mock_session([
+        # First call
+        (200, []),  # previous_race
+        (200, []),  # next_race
+        (200, [{"run_id": "abc", "run_name": "Race"}]),  # live_race
+        (200, {"version": "2026.02.25", "environment": "production"}),  # config
+        # Second call: live only, backend error
+        (502, None),  # live_race
+    ])
+
+    coordinator = coordinator_factory(mock_session)
+    coordinator._manage_ws_connection = AsyncMock()
+
+    await coordinator._async_update_data()
+    data = await coordinator._async_update_data()
+
+    assert data["live_race"] == [{"run_id": "abc", "run_name": "Race"}]
+
+
+@pytest.mark.asyncio
+async def test_live_race_drops_malformed_entries(coordinator_factory):
+    """Test non-dict live race entries are dropped and the current race exposed."""
+    race = {"run_id": "abc", "run_name": "Race"}
+    mock_session = make_mock_session([
+        (200, []),  # previous_race
+        (200, []),  # next_race
+        (200, ["bogus", race]),  # live_race
+        (200, {"version": "2026.02.25", "environment": "production"}),  # config
+    ])
+
+    coordinator = coordinator_factory(mock_session)
+    coordinator._manage_ws_connection = AsyncMock()
+
+    data = await coordinator._async_update_data()
+
+    assert data["live_race"] == [race]
+    assert data["live_race_current"] == race
 
 
 @pytest.mark.asyncio
-async def test_coordinator_config_failure_graceful():
+async def test_coordinator_indexes_races_by_series(coordinator_factory):
+    """Test previous/next races are indexed by series name on fetch."""
+    cup = {"id": 1, "series_name": "NASCAR Cup Series"}
+    trucks = {"id": 2, "series_name": "NASCAR Truck Series"}
+    mock_session = make_mock_session([
+        (200, [cup, trucks]),  # previous_race
+        (200, [trucks]),  # next_race
+        (200, []),  # live_race
+        (200, {"version": "2026.02.25", "environment": "production"}),  # config
+    ])
+
+    coordinator = coordinator_factory(mock_session)
+    data = await coordinator._async_update_data()
+
+    assert data["previous_race_by_series"] == {
+        "NASCAR Cup Series": cup,
+        "NASCAR Truck Series": trucks,
+    }
+    assert data["next_race_by_series"] == {"NASCAR Truck Series": trucks}
+
+
+def test_races_by_series_keeps_first_match():
+    """Test duplicate series keep the first race, matching the old linear scan."""
+    first = {"id": 1, "series_name": "NASCAR Cup Series"}
+    second = {"id": 2, "series_name": "NASCAR Cup Series"}
+
+    assert races_by_series([first, second, "bogus", {"id": 3}]) == {
+        "NASCAR Cup Series": first
+    }
+
+
+@pytest.mark.asyncio
+async def test_coordinator_config_failure_graceful(coordinator_factory):
     """Test that config fetch failure doesn't break the coordinator."""
-    mock_session = _make_mock_session([
+    mock_session = make_mock_session([
         (200, [{"id": 1}]),  # previous_race
         (200, []),  # next_race
         (200, []),  # live_race
         (500, None),  # config (error)
     ])
 
-    coordinator = _make_coordinator(mock_session)
+    coordinator = coordinator_factory(mock_session)
 
     data = await coordinator._async_update_data()
 
@@ -161,3 +259,32 @@ async def test_coordinator_config_failure_graceful():
     assert data["previous_race"] == [{"id": 1}]
     assert data["config"] is None
     assert coordinator.backend_version == "unknown"
+
+
+@pytest.mark.asyncio
+async def test_live_poll_backs_off_when_no_race(coordinator_factory):
+    """Test the update interval grows while /api/live/ stays empty and resets."""
+    mock_session = make_mock_session([
+        (200, []),  # previous_race
+        (200, []),  # next_race
+        (200, []),  # live_race
+        (200, {"version": "2026.02.25", "environment": "production"}),  # config
+        (200, []),  # live_race
+        (200, [{"id": "abc-123"}]),  # live_race
+    ])
+
+    coordinator = coordinator_factory(mock_session)
+
+    await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=30)
+    await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=60)
+
+    for _ in range(10):
+        coordinator._update_live_backoff([])
+    assert coordinator.update_interval == timedelta(minutes=10)
+
+    with patch.object(coordinator, "_manage_ws_connection", new_callable=AsyncMock):
+        await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=15)
+    assert coordinator._empty_live_streak == 0
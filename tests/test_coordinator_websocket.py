@@ -3,42 +3,12 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from custom_components.galaxie.coordinator import GalaxieDataCoordinator
+from custom_components.galaxie.const import (
+    UPDATE_INTERVAL_LIVE,
+    UPDATE_INTERVAL_PREVIOUS_NEXT,
+)
 
-
-def _make_mock_session(responses):
-    """Create a mock session that returns different responses per call."""
-    mock_session = AsyncMock()
-    call_count = 0
-
-    def make_context_manager(*args, **kwargs):
-        nonlocal call_count
-        idx = min(call_count, len(responses) - 1)
-        status, json_data = responses[idx]
-        call_count += 1
-
-        mock_response = AsyncMock()
-        mock_response.status = status
-        mock_response.json = AsyncMock(return_value=json_data)
-
-        cm = AsyncMock()
-        cm.__aenter__ = AsyncMock(return_value=mock_response)
-        cm.__aexit__ = AsyncMock(return_value=False)
-        return cm
-
-    mock_session.get = MagicMock(side_effect=make_context_manager)
-    return mock_session
-
-
-def _make_coordinator(mock_session):
-    """Create a coordinator with mocked HA internals."""
-    mock_hass = AsyncMock()
-    with patch(
-        "homeassistant.helpers.frame.report_usage",
-        MagicMock(),
-    ):
-        coordinator = GalaxieDataCoordinator(mock_hass, mock_session)
-    return coordinator
+from .common import make_mock_session
 
 
 LIVE_RACE_DATA = {
@@ -53,15 +23,15 @@ CONFIG_DATA = {"version": "2026.02.25", "environment": "production"}
 
 
 @pytest.mark.asyncio
-async def test_ws_starts_when_live_race_detected():
+async def test_ws_starts_when_live_race_detected(coordinator_factory):
     """Test that WS connection starts when a live race is discovered via REST."""
-    mock_session = _make_mock_session([
+    mock_session = make_mock_session([
         (200, []),  # previous_race
         (200, []),  # next_race
         (200, [LIVE_RACE_DATA]),  # live_race with run id
         (200, CONFIG_DATA),  # config
     ])
-    coordinator = _make_coordinator(mock_session)
+    coordinator = coordinator_factory(mock_session)
 
     with patch.object(
         coordinator, "_manage_ws_connection", new_callable=AsyncMock
@@ -74,10 +44,10 @@ async def test_ws_starts_when_live_race_detected():
 
 
 @pytest.mark.asyncio
-async def test_manage_ws_starts_client():
+async def test_manage_ws_starts_client(coordinator_factory):
     """Test _manage_ws_connection creates and starts a WS client."""
     mock_session = AsyncMock()
-    coordinator = _make_coordinator(mock_session)
+    coordinator = coordinator_factory(mock_session)
 
     assert coordinator._ws_client is None
     assert coordinator._current_run_id is None
@@ -97,10 +67,10 @@ async def test_manage_ws_starts_client():
 
 
 @pytest.mark.asyncio
-async def test_manage_ws_stops_on_no_live_race():
+async def test_manage_ws_stops_on_no_live_race(coordinator_factory):
     """Test WS is stopped when no live race is active."""
     mock_session = AsyncMock()
-    coordinator = _make_coordinator(mock_session)
+    coordinator = coordinator_factory(mock_session)
 
     mock_client = AsyncMock()
     coordinator._ws_client = mock_client
@@ -116,10 +86,10 @@ async def test_manage_ws_stops_on_no_live_race():
 
 
 @pytest.mark.asyncio
-async def test_manage_ws_reconnects_on_run_id_change():
+async def test_manage_ws_reconnects_on_run_id_change(coordinator_factory):
     """Test WS reconnects when a different run becomes live."""
     mock_session = AsyncMock()
-    coordinator = _make_coordinator(mock_session)
+    coordinator = coordinator_factory(mock_session)
 
     old_client = AsyncMock()
     coordinator._ws_client = old_client
@@ -141,10 +111,10 @@ async def test_manage_ws_reconnects_on_run_id_change():
 
 
 @pytest.mark.asyncio
-async def test_manage_ws_no_op_for_same_run():
+async def test_manage_ws_no_op_for_same_run(coordinator_factory):
     """Test that _manage_ws_connection doesn't reconnect for the same run."""
     mock_session = AsyncMock()
-    coordinator = _make_coordinator(mock_session)
+    coordinator = coordinator_factory(mock_session)
 
     mock_client = MagicMock()
     coordinator._ws_client = mock_client
@@ -160,16 +130,16 @@ async def test_manage_ws_no_op_for_same_run():
 
 
 @pytest.mark.asyncio
-async def test_rest_live_fetch_skipped_when_ws_active():
+async def test_rest_live_fetch_skipped_when_ws_active(coordinator_factory):
     """Test that REST /api/live/ is skipped when WebSocket is delivering data."""
-    mock_session = _make_mock_session([
+    mock_session = make_mock_session([
         (200, []),  # previous_race
         (200, []),  # next_race
         # No live_race call expected!
         (200, CONFIG_DATA),  # config
         (200, {"current": {"temp": 75}}),  # weather (live race active)
     ])
-    coordinator = _make_coordinator(mock_session)
+    coordinator = coordinator_factory(mock_session)
 
     # Simulate active WS
     mock_client = MagicMock()
@@ -187,19 +157,21 @@ async def test_rest_live_fetch_skipped_when_ws_active():
     assert data["live_race"] == [LIVE_RACE_DATA]
     # 4 REST calls: previous, next, config, weather (no live)
     assert mock_session.get.call_count == 4
+    # REST polling slows to the previous/next cadence while WS is up
+    assert coordinator.update_interval == UPDATE_INTERVAL_PREVIOUS_NEXT
 
 
 @pytest.mark.asyncio
-async def test_rest_fallback_when_ws_disconnected():
+async def test_rest_fallback_when_ws_disconnected(coordinator_factory):
     """Test that REST polling resumes when WS is not connected."""
-    mock_session = _make_mock_session([
+    mock_session = make_mock_session([
         (200, []),  # previous_race
         (200, []),  # next_race
         (200, [LIVE_RACE_DATA]),  # live_race via REST
         (200, CONFIG_DATA),  # config
         (200, {"current": {"temp": 75}}),  # weather (live race active)
     ])
-    coordinator = _make_coordinator(mock_session)
+    coordinator = coordinator_factory(mock_session)
 
     # WS client exists but is disconnected
     mock_client = MagicMock()
@@ -219,10 +191,10 @@ async def test_rest_fallback_when_ws_disconnected():
 
 
 @pytest.mark.asyncio
-async def test_ws_on_run_detail_updates_data():
+async def test_ws_on_run_detail_updates_data(coordinator_factory):
     """Test that WS run_detail callback updates coordinator data."""
     mock_session = AsyncMock()
-    coordinator = _make_coordinator(mock_session)
+    coordinator = coordinator_factory(mock_session)
     coordinator.data = {
         "previous_race": [],
         "next_race": [],
@@ -230,29 +202,79 @@ async def test_ws_on_run_detail_updates_data():
         "config": None,
     }
 
+    coordinator.hass.loop = MagicMock()
+
     updated_race = {**LIVE_RACE_DATA, "lap_number": 50}
 
     with patch.object(coordinator, "async_set_updated_data") as mock_set:
         coordinator._ws_on_run_detail(updated_race)
+        mock_set.assert_not_called()
+        coordinator._flush_push()
 
     assert coordinator._ws_live_data == updated_race
     assert coordinator.data["live_race"] == [updated_race]
+    assert coordinator.data["live_race_current"] == updated_race
     mock_set.assert_called_once_with(coordinator.data)
 
 
 @pytest.mark.asyncio
-async def test_ws_on_disconnect_clears_state():
+async def test_ws_pushes_coalesced_into_one_update(coordinator_factory):
+    """Test run_detail + vehicle_list pushes share a single listener update."""
+    mock_session = AsyncMock()
+    coordinator = coordinator_factory(mock_session)
+    coordinator.data = {"live_race": [], "vehicle_list": []}
+    coordinator.hass.loop = MagicMock()
+
+    with patch.object(coordinator, "async_set_updated_data") as mock_set:
+        coordinator._ws_on_run_detail(LIVE_RACE_DATA)
+        coordinator._ws_on_vehicle_list([{"running_position": 1}])
+        coordinator.hass.loop.call_later.assert_called_once()
+        coordinator._flush_push()
+
+    mock_set.assert_called_once_with(coordinator.data)
+    assert coordinator._push_handle is None
+
+
+@pytest.mark.asyncio
+async def test_ws_vehicle_list_burst_keeps_latest_snapshot(coordinator_factory):
+    """Test only the newest vehicle_list snapshot is applied on flush."""
+    mock_session = AsyncMock()
+    coordinator = coordinator_factory(mock_session)
+    coordinator.data = {"live_race": [], "vehicle_list": []}
+    coordinator.hass.loop = MagicMock()
+
+    first = [{"display_name": "Driver A", "running_position": 1}]
+    latest = [{"display_name": "Driver B", "running_position": 1}]
+
+    with patch.object(coordinator, "async_set_updated_data") as mock_set:
+        coordinator._ws_on_vehicle_list(first)
+        coordinator._ws_on_vehicle_list(latest)
+        assert coordinator.data["vehicle_list"] == []
+        coordinator._flush_push()
+
+    coordinator.hass.loop.call_later.assert_called_once()
+    mock_set.assert_called_once_with(coordinator.data)
+    assert coordinator.data["vehicle_list"] == latest
+    assert coordinator.data["vehicle_list_by_position"] == {1: latest[0]}
+    assert coordinator._pending_vehicle is None
+
+
+@pytest.mark.asyncio
+async def test_ws_on_disconnect_clears_state(coordinator_factory):
     """Test that WS disconnect callback clears WS-related state."""
     mock_session = AsyncMock()
-    coordinator = _make_coordinator(mock_session)
+    coordinator = coordinator_factory(mock_session)
 
     coordinator._ws_client = MagicMock()
     coordinator._current_run_id = "abc-123"
     coordinator._ws_live_data = LIVE_RACE_DATA
     coordinator._ws_vehicle_data = [{"display_name": "Driver A"}]
 
+    coordinator.update_interval = UPDATE_INTERVAL_PREVIOUS_NEXT
+
     coordinator._ws_on_disconnect()
 
+    assert coordinator.update_interval == UPDATE_INTERVAL_LIVE
     assert coordinator._ws_client is None
     assert coordinator._current_run_id is None
     assert coordinator._ws_live_data is None
@@ -260,10 +282,59 @@ async def test_ws_on_disconnect_clears_state():
 
 
 @pytest.mark.asyncio
-async def test_async_shutdown_stops_ws():
+async def test_ws_on_disconnect_requests_live_refresh(coordinator_factory):
+    """Test a disconnect pulls the next REST poll forward at the live cadence."""
+    coordinator = coordinator_factory(AsyncMock())
+    coordinator._ws_client = MagicMock()
+    coordinator.update_interval = UPDATE_INTERVAL_PREVIOUS_NEXT
+    coordinator.async_request_refresh = AsyncMock()
+
+    coordinator._ws_on_disconnect()
+
+    assert coordinator.update_interval == UPDATE_INTERVAL_LIVE
+    coordinator.async_request_refresh.assert_called_once()
+    coordinator.hass.async_create_task.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_ws_connection_lost_requests_live_refresh(coordinator_factory):
+    """Test a transient drop resumes REST polling but keeps the client."""
+    coordinator = coordinator_factory(AsyncMock())
+    ws_client = MagicMock()
+    coordinator._ws_client = ws_client
+    coordinator._current_run_id = "abc-123"
+    coordinator.update_interval = UPDATE_INTERVAL_PREVIOUS_NEXT
+    coordinator.async_request_refresh = AsyncMock()
+
+    coordinator._ws_on_connection_lost()
+
+    assert coordinator.update_interval == UPDATE_INTERVAL_LIVE
+    coordinator.async_request_refresh.assert_called_once()
+    # centrifuge-python is reconnecting; the client and run stay in place
+    assert coordinator._ws_client is ws_client
+    assert coordinator._current_run_id == "abc-123"
+
+
+@pytest.mark.asyncio
+async def test_ws_disconnect_during_update_does_not_request_refresh(
+    coordinator_factory,
+):
+    """Test a stop() from inside an update leaves rescheduling to the update."""
+    coordinator = coordinator_factory(AsyncMock())
+    coordinator.async_request_refresh = AsyncMock()
+    coordinator._updating = True
+
+    coordinator._ws_on_disconnect()
+
+    assert coordinator.update_interval == UPDATE_INTERVAL_LIVE
+    coordinator.async_request_refresh.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_shutdown_stops_ws(coordinator_factory):
     """Test that async_shutdown stops the WS client."""
     mock_session = AsyncMock()
-    coordinator = _make_coordinator(mock_session)
+    coordinator = coordinator_factory(mock_session)
 
     mock_client = AsyncMock()
     coordinator._ws_client = mock_client
@@ -277,19 +348,36 @@ async def test_async_shutdown_stops_ws():
 
 
 @pytest.mark.asyncio
-async def test_async_shutdown_no_op_without_ws():
+async def test_async_shutdown_no_op_without_ws(coordinator_factory):
     """Test that async_shutdown is safe when no WS client exists."""
     mock_session = AsyncMock()
-    coordinator = _make_coordinator(mock_session)
+    coordinator = coordinator_factory(mock_session)
 
     await coordinator.async_shutdown()  # Should not raise
 
 
 @pytest.mark.asyncio
-async def test_ws_on_vehicle_list_updates_data():
+async def test_async_shutdown_cancels_pending_push(coordinator_factory):
+    """Test that async_shutdown cancels a scheduled push flush."""
+    mock_session = AsyncMock()
+    coordinator = coordinator_factory(mock_session)
+
+    handle = MagicMock()
+    coordinator._push_handle = handle
+    coordinator._pending_vehicle = [{"vehicle_number": "1"}]
+
+    await coordinator.async_shutdown()
+
+    handle.cancel.assert_called_once()
+    assert coordinator._push_handle is None
+    assert coordinator._pending_vehicle is None
+
+
+@pytest.mark.asyncio
+async def test_ws_on_vehicle_list_updates_data(coordinator_factory):
     """Test that WS vehicle_list callback updates coordinator data."""
     mock_session = AsyncMock()
-    coordinator = _make_coordinator(mock_session)
+    coordinator = coordinator_factory(mock_session)
     coordinator.data = {
         "previous_race": [],
         "next_race": [],
@@ -304,8 +392,11 @@ async def test_ws_on_vehicle_list_updates_data():
         {"vehicle_id": 2, "display_name": "Driver B", "running_position": 2},
     ]
 
+    coordinator.hass.loop = MagicMock()
+
     with patch.object(coordinator, "async_set_updated_data") as mock_set:
         coordinator._ws_on_vehicle_list(vehicle_data)
+        coordinator._flush_push()
 
     assert coordinator._ws_vehicle_data == vehicle_data
     assert coordinator.data["vehicle_list"] == vehicle_data
@@ -313,15 +404,15 @@ async def test_ws_on_vehicle_list_updates_data():
 
 
 @pytest.mark.asyncio
-async def test_vehicle_list_in_update_data():
+async def test_vehicle_list_in_update_data(coordinator_factory):
     """Test that vehicle_list appears in coordinator data output."""
-    mock_session = _make_mock_session([
+    mock_session = make_mock_session([
         (200, []),  # previous_race
         (200, []),  # next_race
         (200, [LIVE_RACE_DATA]),  # live_race
         (200, CONFIG_DATA),  # config
     ])
-    coordinator = _make_coordinator(mock_session)
+    coordinator = coordinator_factory(mock_session)
 
     vehicle_data = [{"display_name": "Driver A", "running_position": 1}]
     coordinator._ws_vehicle_data = vehicle_data
@@ -335,10 +426,10 @@ async def test_vehicle_list_in_update_data():
 
 
 @pytest.mark.asyncio
-async def test_manage_ws_clears_vehicle_and_weather_on_no_live():
+async def test_manage_ws_clears_vehicle_and_weather_on_no_live(coordinator_factory):
     """Test that vehicle and weather data are cleared when no live race."""
     mock_session = AsyncMock()
-    coordinator = _make_coordinator(mock_session)
+    coordinator = coordinator_factory(mock_session)
 
     mock_client = AsyncMock()
     coordinator._ws_client = mock_client
@@ -355,16 +446,16 @@ async def test_manage_ws_clears_vehicle_and_weather_on_no_live():
 
 
 @pytest.mark.asyncio
-async def test_weather_fetched_when_live_race():
+async def test_weather_fetched_when_live_race(coordinator_factory):
     """Test that weather is fetched when a live race is active."""
-    mock_session = _make_mock_session([
+    mock_session = make_mock_session([
         (200, []),  # previous_race
         (200, []),  # next_race
         (200, [LIVE_RACE_DATA]),  # live_race
         (200, CONFIG_DATA),  # config
         (200, {"current": {"temp": 75}}),  # weather
     ])
-    coordinator = _make_coordinator(mock_session)
+    coordinator = coordinator_factory(mock_session)
 
     with patch.object(
         coordinator,
@@ -382,15 +473,15 @@ async def test_weather_fetched_when_live_race():
 
 
 @pytest.mark.asyncio
-async def test_weather_not_fetched_when_no_live_race():
+async def test_weather_not_fetched_when_no_live_race(coordinator_factory):
     """Test that weather is not fetched when no live race."""
-    mock_session = _make_mock_session([
+    mock_session = make_mock_session([
         (200, []),  # previous_race
         (200, []),  # next_race
         (200, []),  # live_race (empty)
         (200, CONFIG_DATA),  # config
     ])
-    coordinator = _make_coordinator(mock_session)
+    coordinator = coordinator_factory(mock_session)
 
     with patch.object(
         coordinator, "_manage_ws_connection", new_callable=AsyncMock
@@ -403,10 +494,10 @@ async def test_weather_not_fetched_when_no_live_race():
 
 
 @pytest.mark.asyncio
-async def test_async_shutdown_clears_weather():
+async def test_async_shutdown_clears_weather(coordinator_factory):
     """Test that async_shutdown clears weather data."""
     mock_session = AsyncMock()
-    coordinator = _make_coordinator(mock_session)
+    coordinator = coordinator_factory(mock_session)
 
     coordinator._weather_data = {"current": {"temp": 75}}
     coordinator._last_weather_fetch = MagicMock()
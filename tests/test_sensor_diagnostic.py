@@ -1,6 +1,7 @@
 """Test the Galaxie backend version diagnostic sensor."""
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 from homeassistant.helpers.entity import EntityCategory
@@ -8,60 +9,67 @@ from homeassistant.helpers.entity import EntityCategory
 from custom_components.galaxie.sensor import BackendVersionSensor
 
 
+def _noop(*args, **kwargs):
+    """Stand in for coordinator methods the tests never assert on."""
+
+
 def _make_mock_coordinator(data=None, last_update_success=True):
     """Create a mock coordinator with given data."""
-    coordinator = MagicMock()
+    coordinator = SimpleNamespace(async_add_listener=_noop)
     coordinator.data = data
     coordinator.last_update_success = last_update_success
-    coordinator.async_add_listener = MagicMock()
     coordinator.backend_version = "unknown"
     if data and data.get("config"):
         coordinator.backend_version = data["config"].get("version", "unknown")
     return coordinator
 
 
+@pytest.fixture(scope="module")
+def default_sensor():
+    """Backend version sensor on a coordinator that has fetched nothing."""
+    return BackendVersionSensor(_make_mock_coordinator())
+
+
 class TestBackendVersionSensor:
     """Test the BackendVersionSensor."""
 
-    def test_entity_category_is_diagnostic(self):
+    def test_entity_category_is_diagnostic(self, default_sensor):
         """Test that the sensor has diagnostic entity category."""
-        coordinator = _make_mock_coordinator()
-        sensor = BackendVersionSensor(coordinator)
-        assert sensor._attr_entity_category == EntityCategory.DIAGNOSTIC
-
-    def test_unique_id(self):
-        """Test unique ID is set correctly."""
-        coordinator = _make_mock_coordinator()
-        sensor = BackendVersionSensor(coordinator)
-        assert sensor._attr_unique_id == "galaxie_backend_version"
-
-    def test_native_value_returns_version(self):
-        """Test that native_value returns the backend version."""
-        coordinator = _make_mock_coordinator(data={
-            "config": {"version": "2026.02.25", "environment": "production"},
-            "previous_race": [],
-            "next_race": [],
-            "live_race": [],
-        })
-        sensor = BackendVersionSensor(coordinator)
-        assert sensor.native_value == "2026.02.25"
+        assert default_sensor._attr_entity_category == EntityCategory.DIAGNOSTIC
 
-    def test_native_value_returns_none_when_no_config(self):
-        """Test that native_value returns None when config is missing."""
-        coordinator = _make_mock_coordinator(data={
-            "config": None,
-            "previous_race": [],
-            "next_race": [],
-            "live_race": [],
-        })
-        sensor = BackendVersionSensor(coordinator)
-        assert sensor.native_value is None
+    def test_not_polled(self, default_sensor):
+        """Test the sensor relies on coordinator pushes instead of polling."""
+        assert default_sensor.should_poll is False
 
-    def test_native_value_returns_none_when_no_data(self):
-        """Test that native_value returns None when coordinator has no data."""
-        coordinator = _make_mock_coordinator(data=None)
+    def test_unique_id(self, default_sensor):
+        """Test unique ID is set correctly."""
+        assert default_sensor._attr_unique_id == "galaxie_backend_version"
+
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            (
+                {
+                    "config": {"version": "2026.02.25", "environment": "production"},
+                    "previous_race": [],
+                    "next_race": [],
+                    "live_race": [],
+                },
+                "2026.02.25",
+            ),
+            (
+                {"config": None, "previous_race": [], "next_race": [], "live_race": []},
+                None,
+            ),
+            (None, None),
+        ],
+        ids=["version", "no_config", "no_data"],
+    )
+    def test_native_value(self, data, expected):
+        """Test native_value returns the backend version, or None without one."""
+        coordinator = _make_mock_coordinator(data=data)
         sensor = BackendVersionSensor(coordinator)
-        assert sensor.native_value is None
+        assert sensor.native_value == expected
 
     def test_extra_state_attributes(self):
         """Test extra state attributes include environment info."""
@@ -84,41 +92,52 @@ class TestBackendVersionSensor:
         assert attrs["timezone"] == "US/Eastern"
         assert attrs["websockets_enabled"] is True
 
+    def test_extra_state_attributes_reused_until_config_changes(self):
+        """Test the attributes dict is rebuilt only for a new config payload."""
+        coordinator = _make_mock_coordinator(data={
+            "config": {"version": "2026.02.25", "environment": "production"},
+        })
+        sensor = BackendVersionSensor(coordinator)
+        attrs = sensor.extra_state_attributes
+        assert sensor.extra_state_attributes is attrs
+
+        coordinator.data["config"] = {"version": "2026.03.01", "environment": "staging"}
+        assert sensor.extra_state_attributes["environment"] == "staging"
+
     def test_extra_state_attributes_none_when_no_config(self):
         """Test extra attributes are None when config is missing."""
         coordinator = _make_mock_coordinator(data={"config": None})
         sensor = BackendVersionSensor(coordinator)
         assert sensor.extra_state_attributes is None
 
-    def test_available_when_config_present(self):
-        """Test sensor is available when config data exists."""
+    @pytest.mark.parametrize(
+        ("data", "last_update_success", "expected"),
+        [
+            ({"config": {"version": "2026.02.25"}}, True, True),
+            ({"config": None}, True, False),
+            ({"config": {"version": "2026.02.25"}}, False, False),
+        ],
+        ids=["config_present", "config_missing", "update_failed"],
+    )
+    def test_available(self, data, last_update_success, expected):
+        """Test availability needs both a config payload and a good update."""
         coordinator = _make_mock_coordinator(
-            data={"config": {"version": "2026.02.25"}},
-            last_update_success=True,
+            data=data, last_update_success=last_update_success
         )
         sensor = BackendVersionSensor(coordinator)
-        assert sensor.available is True
+        assert sensor.available is expected
 
-    def test_unavailable_when_config_missing(self):
-        """Test sensor is unavailable when config data is None."""
-        coordinator = _make_mock_coordinator(
-            data={"config": None},
-            last_update_success=True,
-        )
+    def test_available_follows_coordinator_updates(self):
+        """Test availability is recomputed when the coordinator updates."""
+        coordinator = _make_mock_coordinator(data={"config": None})
         sensor = BackendVersionSensor(coordinator)
+        sensor.async_write_ha_state = MagicMock()
         assert sensor.available is False
 
-    def test_unavailable_when_update_failed(self):
-        """Test sensor is unavailable when last update failed."""
-        coordinator = _make_mock_coordinator(
-            data={"config": {"version": "2026.02.25"}},
-            last_update_success=False,
-        )
-        sensor = BackendVersionSensor(coordinator)
-        assert sensor.available is False
+        coordinator.data = {"config": {"version": "2026.02.25"}}
+        sensor._handle_coordinator_update()
+        assert sensor.available is True
 
-    def test_icon(self):
+    def test_icon(self, default_sensor):
         """Test the sensor icon."""
-        coordinator = _make_mock_coordinator()
-        sensor = BackendVersionSensor(coordinator)
-        assert sensor._attr_icon == "mdi:information-outline"
+        assert default_sensor._attr_icon == "mdi:information-outline"
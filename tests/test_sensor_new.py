@@ -1,14 +1,25 @@
 """Test the new Galaxie sensors: position, weather, caution, series, race name, track type."""
 
+import copy
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
+import pytest
+
+from custom_components.galaxie.coordinator import (
+    GalaxieDataCoordinator,
+    races_by_series,
+)
 from custom_components.galaxie.sensor import (
     LiveRaceActualDistanceSensor,
     LiveRaceCautionCountSensor,
     LiveRacePitStopDeltaSensor,
     LiveRaceSeriesSensor,
+    LiveRaceStartTimeSensor,
     NextRaceNameSensor,
     NextRaceTrackTypeSensor,
+    PreviousRaceDateSensor,
     PreviousRaceNameSensor,
     PreviousRaceTrackTypeSensor,
     VehiclePositionSensor,
@@ -20,17 +31,37 @@ from custom_components.galaxie.sensor import (
     WeatherWindSpeedSensor,
 )
 
+# Same shaping the coordinator applies to fetched and pushed data
+_set_live_race = GalaxieDataCoordinator._set_live_race
+_set_vehicle_list = GalaxieDataCoordinator._set_vehicle_list
+
+
+def _noop(*args, **kwargs):
+    """Stand in for coordinator methods the tests never assert on."""
+
 
 def _make_mock_coordinator(data=None, last_update_success=True):
     """Create a mock coordinator with given data."""
-    coordinator = MagicMock()
+    coordinator = SimpleNamespace(async_add_listener=_noop)
+    if data is not None:
+        data = copy.deepcopy(data)
+        # Derive the indexed keys with the coordinator's own helpers
+        for key in ("previous_race", "next_race"):
+            if key in data:
+                data[f"{key}_by_series"] = races_by_series(data[key])
+        if "live_race" in data:
+            _set_live_race(data, data["live_race"])
+        if "vehicle_list" in data:
+            _set_vehicle_list(data, data["vehicle_list"])
     coordinator.data = data
     coordinator.last_update_success = last_update_success
-    coordinator.async_add_listener = MagicMock()
     coordinator.backend_version = "unknown"
     return coordinator
 
 
+# Shared across tests and workers: never mutate these, copy with {**...} instead.
+# _make_mock_coordinator deep-copies whatever it is given, so coordinator data
+# can be changed freely without touching these.
 LIVE_RACE_DATA = {
     "id": "abc-123",
     "name": "Daytona 500",
@@ -123,6 +154,76 @@ NEXT_RACE = {
 }
 
 
+# Shared read-only coordinators; tests that mutate data build their own.
+@pytest.fixture(scope="module")
+def live_coordinator():
+    """Coordinator with a live race, its running order and track weather."""
+    return _make_mock_coordinator(
+        data={
+            "live_race": [LIVE_RACE_DATA],
+            "vehicle_list": VEHICLE_LIST,
+            "weather": WEATHER_DATA,
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def no_live_race_coordinator():
+    """Coordinator whose last fetch found no race in progress."""
+    return _make_mock_coordinator(
+        data={
+            "live_race": [],
+            "vehicle_list": VEHICLE_LIST,
+            "weather": WEATHER_DATA,
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def no_vehicles_coordinator():
+    """Coordinator with a live race but no running order yet."""
+    return _make_mock_coordinator(
+        data={"live_race": [LIVE_RACE_DATA], "vehicle_list": []}
+    )
+
+
+@pytest.fixture(scope="module")
+def no_weather_coordinator():
+    """Coordinator with a live race whose weather fetch came back empty."""
+    return _make_mock_coordinator(
+        data={
+            "live_race": [LIVE_RACE_DATA],
+            "vehicle_list": VEHICLE_LIST,
+            "weather": None,
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def empty_coordinator():
+    """Coordinator that has not fetched anything yet."""
+    return _make_mock_coordinator()
+
+
+class TestSensorPolling:
+    """Test sensors are driven by the coordinator, not HA polling."""
+
+    @pytest.mark.parametrize(
+        "sensor",
+        [
+            lambda c: PreviousRaceNameSensor(c, "NASCAR Cup Series"),
+            lambda c: NextRaceNameSensor(c, "NASCAR Cup Series"),
+            LiveRaceSeriesSensor,
+            lambda c: VehiclePositionSensor(c, 1),
+            WeatherTemperatureSensor,
+        ],
+        ids=["previous", "next", "live", "position", "weather"],
+    )
+    def test_not_polled(self, empty_coordinator, sensor):
+        """Coordinator-driven sensors must only write state from listener updates."""
+        assert sensor(empty_coordinator).should_poll is False
+
+
 class TestPreviousRaceNameSensor:
     """Test PreviousRaceNameSensor."""
 
@@ -138,9 +239,8 @@ class TestPreviousRaceNameSensor:
         sensor = PreviousRaceNameSensor(coordinator, "NASCAR Cup Series")
         assert sensor.native_value is None
 
-    def test_unique_id(self):
-        coordinator = _make_mock_coordinator()
-        sensor = PreviousRaceNameSensor(coordinator, "NASCAR Cup Series")
+    def test_unique_id(self, empty_coordinator):
+        sensor = PreviousRaceNameSensor(empty_coordinator, "NASCAR Cup Series")
         assert sensor._attr_unique_id == "previous_race_nascar_cup_series_name"
 
 
@@ -155,6 +255,21 @@ class TestPreviousRaceTrackTypeSensor:
         assert sensor.native_value == "Superspeedway"
 
 
+class TestPreviousRaceDateSensor:
+    """Test PreviousRaceDateSensor."""
+
+    def test_parses_utc_race_date(self):
+        race = {**PREVIOUS_RACE, "race_date": "2026-02-15T19:30:00Z"}
+        coordinator = _make_mock_coordinator(data={"previous_race": [race]})
+        sensor = PreviousRaceDateSensor(coordinator, "NASCAR Cup Series")
+        assert sensor.native_value == date(2026, 2, 15)
+
+    def test_missing_race_date(self):
+        coordinator = _make_mock_coordinator(data={"previous_race": [PREVIOUS_RACE]})
+        sensor = PreviousRaceDateSensor(coordinator, "NASCAR Cup Series")
+        assert sensor.native_value is None
+
+
 class TestNextRaceNameSensor:
     """Test NextRaceNameSensor."""
 
@@ -163,9 +278,8 @@ class TestNextRaceNameSensor:
         sensor = NextRaceNameSensor(coordinator, "NASCAR Cup Series")
         assert sensor.native_value == "Atlanta 400"
 
-    def test_unique_id(self):
-        coordinator = _make_mock_coordinator()
-        sensor = NextRaceNameSensor(coordinator, "NASCAR Cup Series")
+    def test_unique_id(self, empty_coordinator):
+        sensor = NextRaceNameSensor(empty_coordinator, "NASCAR Cup Series")
         assert sensor._attr_unique_id == "next_race_nascar_cup_series_name"
 
 
@@ -181,77 +295,122 @@ class TestNextRaceTrackTypeSensor:
 class TestLiveRaceSeriesSensor:
     """Test LiveRaceSeriesSensor."""
 
-    def test_maps_series_id_to_name(self):
-        coordinator = _make_mock_coordinator(
-            data={"live_race": [LIVE_RACE_DATA]}
-        )
+    @pytest.mark.parametrize(
+        ("series_id", "expected"),
+        [
+            (1, "NASCAR Cup Series"),
+            (2, "NASCAR Xfinity Series"),
+            (3, "NASCAR Craftsman Truck Series"),
+            (99, "Unknown (99)"),
+        ],
+    )
+    def test_maps_series_id_to_name(self, series_id, expected):
+        race = {**LIVE_RACE_DATA, "series": series_id}
+        coordinator = _make_mock_coordinator(data={"live_race": [race]})
         sensor = LiveRaceSeriesSensor(coordinator)
-        assert sensor.native_value == "NASCAR Cup Series"
+        assert sensor.native_value == expected
 
-    def test_maps_series_id_2(self):
-        race = {**LIVE_RACE_DATA, "series": 2}
-        coordinator = _make_mock_coordinator(data={"live_race": [race]})
+    def test_unique_id(self, empty_coordinator):
+        sensor = LiveRaceSeriesSensor(empty_coordinator)
+        assert sensor._attr_unique_id == "live_race_series"
+
+    def test_recomputes_only_for_new_race_payload(self):
+        coordinator = _make_mock_coordinator(data={"live_race": [LIVE_RACE_DATA]})
         sensor = LiveRaceSeriesSensor(coordinator)
+        assert sensor.native_value == "NASCAR Cup Series"
+
+        sensor._extract_value = MagicMock(return_value="NASCAR Xfinity Series")
+        assert sensor.native_value == "NASCAR Cup Series"
+        sensor._extract_value.assert_not_called()
+
+        _set_live_race(coordinator.data, [{**LIVE_RACE_DATA, "series": 2}])
         assert sensor.native_value == "NASCAR Xfinity Series"
+        sensor._extract_value.assert_called_once()
 
-    def test_maps_series_id_3(self):
-        race = {**LIVE_RACE_DATA, "series": 3}
-        coordinator = _make_mock_coordinator(data={"live_race": [race]})
+
+class TestLiveRaceStartTimeSensor:
+    """Test LiveRaceStartTimeSensor."""
+
+    def test_parses_utc_start_time(self):
+        coordinator = _make_mock_coordinator(
+            data={
+                "live_race": [
+                    {**LIVE_RACE_DATA, "start_time": "2026-02-15T19:30:00Z"}
+                ]
+            }
+        )
+        sensor = LiveRaceStartTimeSensor(coordinator)
+        assert sensor.native_value == datetime(
+            2026, 2, 15, 19, 30, tzinfo=timezone.utc
+        )
+
+
+class TestLiveRaceAvailability:
+    """Test live race sensors cache availability per coordinator update."""
+
+    def test_available_follows_coordinator_updates(self):
+        coordinator = _make_mock_coordinator(data={"live_race": []})
         sensor = LiveRaceSeriesSensor(coordinator)
-        assert sensor.native_value == "NASCAR Craftsman Truck Series"
+        sensor.async_write_ha_state = MagicMock()
+        assert sensor.available is False
 
-    def test_unknown_series_id(self):
-        race = {**LIVE_RACE_DATA, "series": 99}
-        coordinator = _make_mock_coordinator(data={"live_race": [race]})
+        _set_live_race(coordinator.data, [LIVE_RACE_DATA])
+        sensor._handle_coordinator_update()
+        assert sensor.available is True
+
+        coordinator.last_update_success = False
+        sensor._handle_coordinator_update()
+        assert sensor.available is False
+        assert sensor.async_write_ha_state.call_count == 2
+
+    def test_unavailable_when_live_race_malformed(self):
+        coordinator = _make_mock_coordinator(data={"live_race": ["not-a-race"]})
         sensor = LiveRaceSeriesSensor(coordinator)
-        assert sensor.native_value == "Unknown (99)"
+        assert sensor.available is False
 
-    def test_unique_id(self):
-        coordinator = _make_mock_coordinator()
+    def test_skips_state_write_when_unchanged(self):
+        coordinator = _make_mock_coordinator(data={"live_race": [LIVE_RACE_DATA]})
         sensor = LiveRaceSeriesSensor(coordinator)
-        assert sensor._attr_unique_id == "live_race_series"
+        sensor.async_write_ha_state = MagicMock()
+
+        sensor._handle_coordinator_update()
+        sensor._handle_coordinator_update()
+        assert sensor.async_write_ha_state.call_count == 1
+
+        _set_live_race(coordinator.data, [{**LIVE_RACE_DATA, "series": 2}])
+        sensor._handle_coordinator_update()
+        assert sensor.async_write_ha_state.call_count == 2
 
 
 class TestLiveRacePitStopDeltaSensor:
     """Test LiveRacePitStopDeltaSensor."""
 
-    def test_extracts_pit_stop_delta(self):
-        coordinator = _make_mock_coordinator(
-            data={"live_race": [LIVE_RACE_DATA]}
-        )
-        sensor = LiveRacePitStopDeltaSensor(coordinator)
+    def test_extracts_pit_stop_delta(self, live_coordinator):
+        sensor = LiveRacePitStopDeltaSensor(live_coordinator)
         assert sensor.native_value == 12.5
 
-    def test_unit_is_seconds(self):
-        coordinator = _make_mock_coordinator()
-        sensor = LiveRacePitStopDeltaSensor(coordinator)
+    def test_unit_is_seconds(self, empty_coordinator):
+        sensor = LiveRacePitStopDeltaSensor(empty_coordinator)
         assert sensor._attr_native_unit_of_measurement == "s"
 
 
 class TestLiveRaceActualDistanceSensor:
     """Test LiveRaceActualDistanceSensor."""
 
-    def test_extracts_actual_distance(self):
-        coordinator = _make_mock_coordinator(
-            data={"live_race": [LIVE_RACE_DATA]}
-        )
-        sensor = LiveRaceActualDistanceSensor(coordinator)
+    def test_extracts_actual_distance(self, live_coordinator):
+        sensor = LiveRaceActualDistanceSensor(live_coordinator)
         assert sensor.native_value == 250.5
 
-    def test_unit_is_miles(self):
-        coordinator = _make_mock_coordinator()
-        sensor = LiveRaceActualDistanceSensor(coordinator)
+    def test_unit_is_miles(self, empty_coordinator):
+        sensor = LiveRaceActualDistanceSensor(empty_coordinator)
         assert sensor._attr_native_unit_of_measurement == "miles"
 
 
 class TestLiveRaceCautionCountSensor:
     """Test LiveRaceCautionCountSensor."""
 
-    def test_counts_yellow_flags(self):
-        coordinator = _make_mock_coordinator(
-            data={"live_race": [LIVE_RACE_DATA]}
-        )
-        sensor = LiveRaceCautionCountSensor(coordinator)
+    def test_counts_yellow_flags(self, live_coordinator):
+        sensor = LiveRaceCautionCountSensor(live_coordinator)
         # 3 entries with flag == 2
         assert sensor.native_value == 3
 
@@ -280,34 +439,21 @@ class TestLiveRaceCautionCountSensor:
 class TestVehiclePositionSensor:
     """Test VehiclePositionSensor."""
 
-    def test_p1_returns_leader(self):
-        coordinator = _make_mock_coordinator(
-            data={
-                "live_race": [LIVE_RACE_DATA],
-                "vehicle_list": VEHICLE_LIST,
-            }
-        )
-        sensor = VehiclePositionSensor(coordinator, 1)
-        assert sensor.native_value == "Kyle Larson"
-
-    def test_p5_returns_fifth_place(self):
-        coordinator = _make_mock_coordinator(
-            data={
-                "live_race": [LIVE_RACE_DATA],
-                "vehicle_list": VEHICLE_LIST,
-            }
-        )
-        sensor = VehiclePositionSensor(coordinator, 5)
-        assert sensor.native_value == "Martin Truex Jr."
-
-    def test_extra_attributes_include_vehicle_details(self):
-        coordinator = _make_mock_coordinator(
-            data={
-                "live_race": [LIVE_RACE_DATA],
-                "vehicle_list": VEHICLE_LIST,
-            }
-        )
-        sensor = VehiclePositionSensor(coordinator, 1)
+    @pytest.mark.parametrize(
+        ("pos", "expected"),
+        [(1, "Kyle Larson"), (3, "Denny Hamlin"), (5, "Martin Truex Jr.")],
+    )
+    def test_returns_driver_at_position(self, live_coordinator, pos, expected):
+        sensor = VehiclePositionSensor(live_coordinator, pos)
+        assert sensor.native_value == expected
+
+    def test_unique_id_and_name(self, empty_coordinator):
+        sensor = VehiclePositionSensor(empty_coordinator, 3)
+        assert sensor._attr_unique_id == "live_race_position_3"
+        assert sensor._attr_name == "Live Race Position 3"
+
+    def test_extra_attributes_include_vehicle_details(self, live_coordinator):
+        sensor = VehiclePositionSensor(live_coordinator, 1)
         attrs = sensor.extra_state_attributes
         assert attrs is not None
         assert attrs["vehicle_number"] == "5"
@@ -315,47 +461,22 @@ class TestVehiclePositionSensor:
         assert attrs["manufacturer"] == "Chevrolet"
         assert attrs["sponsor"] == "HendrickCars.com"
 
-    def test_returns_none_when_no_vehicles(self):
-        coordinator = _make_mock_coordinator(
-            data={
-                "live_race": [LIVE_RACE_DATA],
-                "vehicle_list": [],
-            }
-        )
-        sensor = VehiclePositionSensor(coordinator, 1)
-        assert sensor.native_value is None
-
-    def test_returns_none_when_position_not_found(self):
+    def test_extra_attributes_follow_new_snapshot(self):
         coordinator = _make_mock_coordinator(
             data={
                 "live_race": [LIVE_RACE_DATA],
                 "vehicle_list": VEHICLE_LIST,
             }
         )
-        sensor = VehiclePositionSensor(coordinator, 99)
-        assert sensor.native_value is None
-
-    def test_unavailable_when_no_live_race(self):
-        coordinator = _make_mock_coordinator(
-            data={
-                "live_race": [],
-                "vehicle_list": VEHICLE_LIST,
-            }
-        )
         sensor = VehiclePositionSensor(coordinator, 1)
-        assert sensor.available is False
+        attrs = sensor.extra_state_attributes
+        assert sensor.extra_state_attributes is attrs
 
-    def test_unavailable_when_no_vehicle_data(self):
-        coordinator = _make_mock_coordinator(
-            data={
-                "live_race": [LIVE_RACE_DATA],
-                "vehicle_list": [],
-            }
-        )
-        sensor = VehiclePositionSensor(coordinator, 1)
-        assert sensor.available is False
+        leader = {**VEHICLE_LIST[1], "running_position": 1}
+        _set_vehicle_list(coordinator.data, [leader])
+        assert sensor.extra_state_attributes["vehicle_number"] == "24"
 
-    def test_available_with_data(self):
+    def test_skips_state_write_when_vehicle_unchanged(self):
         coordinator = _make_mock_coordinator(
             data={
                 "live_race": [LIVE_RACE_DATA],
@@ -363,19 +484,77 @@ class TestVehiclePositionSensor:
             }
         )
         sensor = VehiclePositionSensor(coordinator, 1)
-        assert sensor.available is True
+        sensor.async_write_ha_state = MagicMock()
+
+        sensor._handle_coordinator_update()
+        coordinator.data["weather"] = WEATHER_DATA
+        sensor._handle_coordinator_update()
+        assert sensor.async_write_ha_state.call_count == 1
 
-    def test_unique_ids_for_positions(self):
-        coordinator = _make_mock_coordinator()
-        for pos in range(1, 6):
-            sensor = VehiclePositionSensor(coordinator, pos)
-            assert sensor._attr_unique_id == f"live_race_position_{pos}"
+    def test_returns_none_when_no_vehicles(self, no_vehicles_coordinator):
+        sensor = VehiclePositionSensor(no_vehicles_coordinator, 1)
+        assert sensor.native_value is None
+
+    def test_returns_none_when_position_not_found(self, live_coordinator):
+        sensor = VehiclePositionSensor(live_coordinator, 99)
+        assert sensor.native_value is None
+
+    @pytest.mark.parametrize(
+        ("scenario", "expected"),
+        [
+            ("live_coordinator", True),
+            ("no_weather_coordinator", True),
+            ("no_live_race_coordinator", False),
+            ("no_vehicles_coordinator", False),
+        ],
+    )
+    def test_available(self, request, scenario, expected):
+        sensor = VehiclePositionSensor(request.getfixturevalue(scenario), 1)
+        assert sensor.available is expected
+
+    @pytest.mark.parametrize("pos", range(1, 6))
+    def test_unique_ids_for_positions(self, empty_coordinator, pos):
+        sensor = VehiclePositionSensor(empty_coordinator, pos)
+        assert sensor._attr_unique_id == f"live_race_position_{pos}"
+
+
+class TestWeatherSensors:
+    """Test the value each weather sensor reads from the weather payload."""
+
+    @pytest.mark.parametrize(
+        ("sensor_cls", "expected"),
+        [
+            (WeatherTemperatureSensor, 78.5),
+            (WeatherHumiditySensor, 65),
+            (WeatherWindSpeedSensor, 12.3),
+            (WeatherWindDirectionSensor, 180),
+            # 0.35 * 100 = 35
+            (WeatherRainChanceSensor, 35),
+            (WeatherConditionsSensor, "Clouds"),
+        ],
+        ids=lambda v: v.__name__ if isinstance(v, type) else None,
+    )
+    def test_native_value(self, live_coordinator, sensor_cls, expected):
+        sensor = sensor_cls(live_coordinator)
+        assert sensor.native_value == expected
 
 
 class TestWeatherTemperatureSensor:
     """Test WeatherTemperatureSensor."""
 
-    def test_extracts_temperature(self):
+    @pytest.mark.parametrize(
+        ("scenario", "expected"),
+        [
+            ("live_coordinator", True),
+            ("no_weather_coordinator", False),
+            ("no_live_race_coordinator", False),
+        ],
+    )
+    def test_available(self, request, scenario, expected):
+        sensor = WeatherTemperatureSensor(request.getfixturevalue(scenario))
+        assert sensor.available is expected
+
+    def test_follows_new_weather_payload(self):
         coordinator = _make_mock_coordinator(
             data={
                 "live_race": [LIVE_RACE_DATA],
@@ -385,83 +564,13 @@ class TestWeatherTemperatureSensor:
         sensor = WeatherTemperatureSensor(coordinator)
         assert sensor.native_value == 78.5
 
-    def test_unavailable_when_no_weather(self):
-        coordinator = _make_mock_coordinator(
-            data={
-                "live_race": [LIVE_RACE_DATA],
-                "weather": None,
-            }
-        )
-        sensor = WeatherTemperatureSensor(coordinator)
-        assert sensor.available is False
-
-    def test_unavailable_when_no_live_race(self):
-        coordinator = _make_mock_coordinator(
-            data={
-                "live_race": [],
-                "weather": WEATHER_DATA,
-            }
-        )
-        sensor = WeatherTemperatureSensor(coordinator)
-        assert sensor.available is False
-
-
-class TestWeatherHumiditySensor:
-    """Test WeatherHumiditySensor."""
-
-    def test_extracts_humidity(self):
-        coordinator = _make_mock_coordinator(
-            data={
-                "live_race": [LIVE_RACE_DATA],
-                "weather": WEATHER_DATA,
-            }
-        )
-        sensor = WeatherHumiditySensor(coordinator)
-        assert sensor.native_value == 65
-
-
-class TestWeatherWindSpeedSensor:
-    """Test WeatherWindSpeedSensor."""
-
-    def test_extracts_wind_speed(self):
-        coordinator = _make_mock_coordinator(
-            data={
-                "live_race": [LIVE_RACE_DATA],
-                "weather": WEATHER_DATA,
-            }
-        )
-        sensor = WeatherWindSpeedSensor(coordinator)
-        assert sensor.native_value == 12.3
-
-
-class TestWeatherWindDirectionSensor:
-    """Test WeatherWindDirectionSensor."""
-
-    def test_extracts_wind_direction(self):
-        coordinator = _make_mock_coordinator(
-            data={
-                "live_race": [LIVE_RACE_DATA],
-                "weather": WEATHER_DATA,
-            }
-        )
-        sensor = WeatherWindDirectionSensor(coordinator)
-        assert sensor.native_value == 180
+        coordinator.data["weather"] = {"current": {"temp": 81.0}}
+        assert sensor.native_value == 81.0
 
 
 class TestWeatherRainChanceSensor:
     """Test WeatherRainChanceSensor."""
 
-    def test_extracts_rain_probability(self):
-        coordinator = _make_mock_coordinator(
-            data={
-                "live_race": [LIVE_RACE_DATA],
-                "weather": WEATHER_DATA,
-            }
-        )
-        sensor = WeatherRainChanceSensor(coordinator)
-        # 0.35 * 100 = 35
-        assert sensor.native_value == 35
-
     def test_empty_hourly(self):
         weather = {**WEATHER_DATA, "hourly": []}
         coordinator = _make_mock_coordinator(
@@ -488,16 +597,6 @@ class TestWeatherRainChanceSensor:
 class TestWeatherConditionsSensor:
     """Test WeatherConditionsSensor."""
 
-    def test_extracts_conditions(self):
-        coordinator = _make_mock_coordinator(
-            data={
-                "live_race": [LIVE_RACE_DATA],
-                "weather": WEATHER_DATA,
-            }
-        )
-        sensor = WeatherConditionsSensor(coordinator)
-        assert sensor.native_value == "Clouds"
-
     def test_empty_weather_list(self):
         weather = {
             "current": {"temp": 78.5, "weather": []},
@@ -512,7 +611,6 @@ class TestWeatherConditionsSensor:
         sensor = WeatherConditionsSensor(coordinator)
         assert sensor.native_value is None
 
-    def test_unique_id(self):
-        coordinator = _make_mock_coordinator()
-        sensor = WeatherConditionsSensor(coordinator)
+    def test_unique_id(self, empty_coordinator):
+        sensor = WeatherConditionsSensor(empty_coordinator)
         assert sensor._attr_unique_id == "live_race_weather_conditions"
@@ -1,5 +1,6 @@
 """Tests for the Galaxie Centrifugo WebSocket client."""
 
+import logging
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -12,7 +13,12 @@ from custom_components.galaxie.const import (
     CENTRIFUGO_WS_PATH,
     WS_BASE_URL,
 )
-from custom_components.galaxie.websocket_client import GalaxieWebSocketClient
+from custom_components.galaxie import websocket_client
+from custom_components.galaxie.websocket_client import (
+    WS_MAX_RECONNECT_DELAY,
+    WS_MIN_RECONNECT_DELAY,
+    GalaxieWebSocketClient,
+)
 
 
 def _make_ws_client(
@@ -20,8 +26,12 @@ def _make_ws_client(
     on_vehicle_list=None,
     on_disconnect=None,
 ):
-    """Create a GalaxieWebSocketClient with mocked dependencies."""
-    session = AsyncMock()
+    """Create a GalaxieWebSocketClient with mocked dependencies.
+
+    The session is a bare namespace: only the token tests touch it, and they
+    install their own ``post`` mock.
+    """
+    session = SimpleNamespace()
     on_run_detail = on_run_detail or MagicMock()
     on_vehicle_list = on_vehicle_list or MagicMock()
     on_disconnect = on_disconnect or MagicMock()
@@ -151,7 +161,7 @@ def test_handle_non_dict_publication():
     on_vehicle_list.assert_not_called()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_subscription_event_handler_routes_publication():
     """SubscriptionEventHandler.on_publication forwards to _handle_publication_data."""
     client, _, on_run_detail, _, _ = _make_ws_client()
@@ -165,7 +175,7 @@ async def test_subscription_event_handler_routes_publication():
     on_run_detail.assert_called_once_with(run_data)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_client_event_handler_tracks_connection_state():
     """on_connected/on_disconnected toggle the connected flag."""
     client, _, _, _, _ = _make_ws_client()
@@ -178,7 +188,37 @@ async def test_client_event_handler_tracks_connection_state():
     assert client.connected is False
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
+async def test_unexpected_disconnect_reports_connection_lost():
+    """A drop the caller didn't ask for fires on_connection_lost."""
+    on_connection_lost = MagicMock()
+    client, _, _, _, _ = _make_ws_client()
+    client._on_connection_lost = on_connection_lost
+    handler = client._build_client_events()
+
+    await handler.on_disconnected(SimpleNamespace(reason="transport closed"))
+    on_connection_lost.assert_called_once()
+
+    client._closing = True
+    await handler.on_disconnected(SimpleNamespace(reason="disconnect called"))
+    on_connection_lost.assert_called_once()
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_reconnect_logs_at_debug(caplog):
+    """Only the first connect of a run is logged at INFO."""
+    client, _, _, _, _ = _make_ws_client()
+    handler = client._build_client_events()
+
+    with caplog.at_level(logging.DEBUG, logger=websocket_client.__name__):
+        await handler.on_connected(SimpleNamespace(client="c"))
+        await handler.on_connected(SimpleNamespace(client="c"))
+
+    levels = [r.levelno for r in caplog.records if "connected" in r.getMessage()]
+    assert levels == [logging.INFO, logging.DEBUG]
+
+
+@pytest.mark.asyncio(loop_scope="module")
 async def test_get_token_success():
     """_get_token returns the JWT from the token endpoint."""
     client, session, _, _, _ = _make_ws_client()
@@ -197,7 +237,7 @@ async def test_get_token_success():
     session.post.assert_called_once_with(client._token_url)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_get_token_unauthorized():
     """_get_token raises UnauthorizedError on 401."""
     client, session, _, _, _ = _make_ws_client()
@@ -214,7 +254,23 @@ async def test_get_token_unauthorized():
         await client._get_token()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
+async def test_get_token_missing_endpoint_is_terminal():
+    """_get_token raises UnauthorizedError on 404 so reconnects stop."""
+    client, session, _, _, _ = _make_ws_client()
+
+    response = AsyncMock()
+    response.status = 404
+    cm = AsyncMock()
+    cm.__aenter__ = AsyncMock(return_value=response)
+    cm.__aexit__ = AsyncMock(return_value=False)
+    session.post = MagicMock(return_value=cm)
+
+    with pytest.raises(UnauthorizedError):
+        await client._get_token()
+
+
+@pytest.mark.asyncio(loop_scope="module")
 async def test_get_token_empty_token():
     """_get_token raises when the server returns an empty token."""
     client, session, _, _, _ = _make_ws_client()
@@ -231,7 +287,7 @@ async def test_get_token_empty_token():
         await client._get_token()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_start_creates_client_and_subscription():
     """start() instantiates a centrifuge Client and schedules connect/subscribe."""
     client, _, _, _, _ = _make_ws_client()
@@ -254,6 +310,8 @@ async def test_start_creates_client_and_subscription():
         _, kwargs = MockClient.call_args
         assert kwargs["get_token"].__func__ is GalaxieWebSocketClient._get_token
         assert kwargs["use_protobuf"] is False
+        assert kwargs["min_reconnect_delay"] == WS_MIN_RECONNECT_DELAY
+        assert kwargs["max_reconnect_delay"] == WS_MAX_RECONNECT_DELAY
         mock_cent.new_subscription.assert_called_once()
         args, _ = mock_cent.new_subscription.call_args
         assert args[0] == "run:test-run-id"
@@ -271,7 +329,7 @@ def test_start_is_idempotent():
         MockClient.assert_not_called()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_stop_tears_down_client_and_fires_disconnect():
     """stop() disconnects the client and fires on_disconnect exactly once."""
     client, _, _, _, on_disconnect = _make_ws_client()
@@ -286,7 +344,7 @@ async def test_stop_tears_down_client_and_fires_disconnect():
 
     await client.stop()
 
-    mock_sub.unsubscribe.assert_awaited_once()
+    mock_sub.unsubscribe.assert_not_awaited()
     mock_cent.disconnect.assert_awaited_once()
     on_disconnect.assert_called_once()
     assert client._client is None
@@ -295,7 +353,7 @@ async def test_stop_tears_down_client_and_fires_disconnect():
     assert client._closing is True
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_stop_when_not_started():
     """stop() is safe when start() was never called."""
     client, _, _, _, on_disconnect = _make_ws_client()
@@ -306,18 +364,27 @@ async def test_stop_when_not_started():
     on_disconnect.assert_called_once()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_stop_swallows_teardown_errors():
-    """Teardown errors from unsubscribe/disconnect are swallowed."""
+    """Teardown errors from disconnect are swallowed."""
     client, _, _, _, on_disconnect = _make_ws_client()
 
     mock_cent = MagicMock()
     mock_cent.disconnect = AsyncMock(side_effect=RuntimeError("boom"))
-    mock_sub = MagicMock()
-    mock_sub.unsubscribe = AsyncMock(side_effect=RuntimeError("boom"))
     client._client = mock_cent
-    client._sub = mock_sub
 
     await client.stop()  # Must not raise.
 
     on_disconnect.assert_called_once()
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_stop_logs_on_disconnect_errors():
+    """An exception from on_disconnect is logged, not raised out of stop()."""
+    on_disconnect = MagicMock(side_effect=RuntimeError("boom"))
+    client, _, _, _, _ = _make_ws_client(on_disconnect=on_disconnect)
+
+    await client.stop()  # Must not raise.
+    await client.stop()
+
+    on_disconnect.assert_called_once()